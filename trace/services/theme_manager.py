@@ -84,6 +84,7 @@ class ThemeManager(QObject):
         super().__init__(parent)
         self.app = app
         self.current_theme = Theme.LIGHT
+        self._icon_cache: dict[tuple[str, ColorHex, float], QIcon] = {}
         self.app.setStyle(QStyleFactory.create("Fusion"))
 
         self._setup_palettes()
@@ -258,7 +259,8 @@ class ThemeManager(QObject):
         custom_color: ColorHex | None = None,
     ) -> QIcon | None:
         """
-        Create a themed icon using qtawesome.
+        Create a themed icon using qtawesome. Icons are cached by name, color
+        and scale, so each glyph is only rendered once per theme color.
 
         Parameters
         ----------
@@ -283,7 +285,12 @@ class ThemeManager(QObject):
         >>> custom_icon = theme_manager.create_icon('fa.gear', custom_color='#ff0000')
         """
         color = custom_color or self.get_icon_color(color_type)
-        return qta.icon(icon_name, color=color, scale_factor=scale_factor)
+        key = (icon_name, color, scale_factor)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = qta.icon(icon_name, color=color, scale_factor=scale_factor)
+            self._icon_cache[key] = icon
+        return icon
 
     def get_all_icon_colors(self) -> IconColorDict:
         """
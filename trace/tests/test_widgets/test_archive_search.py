@@ -62,6 +62,42 @@ def test_archive_results_table_qtmodeltester(qtmodeltester, search_wid):
     qtmodeltester.check(search_wid.results_table_model, force_py=True)
 
 
+def test_archive_results_table_updates(qtmodeltester, qtbot, search_wid):
+    """Check that the ArchiveResultsTableModel stays valid while its rows change,
+    and that row changes are announced without an extra layoutChanged.
+
+    Parameters
+    ----------
+    qtmodeltester : fixture
+        pytest-qt fixture used for testing the validity of AbstractItemModels
+    qtbot : fixture
+        pytest-qt fixture used to watch the model's signals
+    search_wid : fixture
+        Instance of ArchiveSearchWidget for application testing
+
+    Expectations
+    ------------
+    qtmodeltester finds no issues as rows are replaced, appended, sorted and
+    cleared, and only sorting emits layoutChanged
+    """
+    model = search_wid.results_table_model
+    qtmodeltester.check(model, force_py=True)
+
+    with qtbot.assertNotEmitted(model.layoutChanged):
+        model.replace_rows(["PV:B", "PV:C"])
+        model.append("PV:A")
+        model.replace_rows(["PV:C", "PV:B", "PV:A"])
+    assert model.rowCount() == 3
+
+    with qtbot.waitSignal(model.layoutChanged, timeout=100):
+        model.sort(0)
+    assert model.results_list == ["PV:A", "PV:B", "PV:C"]
+
+    with qtbot.assertNotEmitted(model.layoutChanged):
+        model.clear()
+    assert model.rowCount() == 0
+
+
 @pytest.mark.parametrize(
     ("data_test", "data_expected"),
     (
@@ -179,3 +179,25 @@ def test_index_color(monkeypatch, index, expected_base_color, expected_dark_fact
     expected_color = expected_base_color.darker(expected_dark_factor)
 
     assert color == expected_color
+
+
+def test_index_color_returns_independent_copies(monkeypatch):
+    """Tests that ColorButton.index_color() hands out copies of its cached colors.
+
+    Parameters
+    ----------
+    monkeypatch : fixture
+        To override color_button.color_palette
+
+    Expectations
+    ------------
+    Modifying a color returned by index_color does not change the color
+    returned by a later call with the same index.
+    """
+    monkeypatch.setattr(color_button, "color_palette", TEST_PALETTE)
+
+    first = ColorButton.index_color(1)
+    first.setGreen(0)
+    second = ColorButton.index_color(1)
+
+    assert second == TEST_PALETTE["default"][1]
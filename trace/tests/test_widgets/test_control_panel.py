@@ -1,6 +1,10 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from qtpy import QtGui, QtWidgets
+from qtpy.QtCore import Qt
+
+from widgets import ControlPanel
 
 
 @pytest.fixture
@@ -179,3 +183,347 @@ def test_set_curves_mixed_channel_and_formula(control_panel_with_axis):
 
     mock_add_curve.assert_called_once()
     mock_add_formula.assert_called_once_with(formula)
+
+
+def test_add_curves_emits_curve_list_changed_once(control_panel):
+    """Test that add_curves only emits curve_list_changed once for the batch.
+
+    Parameters
+    ----------
+    control_panel : fixture
+        The ControlPanel from a TraceDisplay instance
+
+    Expectations
+    ------------
+    Emissions made while each curve is added are suppressed, and a single
+    curve_list_changed is emitted after all curves have been added.
+    """
+    emissions = []
+    control_panel.curve_list_changed.connect(lambda: emissions.append(True))
+
+    def fake_add_curve(pv):
+        control_panel.curve_list_changed.emit()
+
+    with patch.object(control_panel, "add_curve", side_effect=fake_add_curve) as mock_add:
+        control_panel.add_curves(["PV:1", "PV:2", "PV:3"])
+
+    assert mock_add.call_count == 3
+    assert len(emissions) == 1
+    assert not control_panel.signalsBlocked()
+    assert control_panel.plot.updatesEnabled()
+    assert control_panel.updatesEnabled()
+
+
+def test_get_axis_item_follows_axis_rename(control_panel_with_axis):
+    """Test that get_axis_item resolves an AxisItem by its current name after a rename.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    After renaming the axis, the old name no longer resolves and the new
+    name returns the same AxisItem.
+    """
+    cp, axis_item = control_panel_with_axis
+    assert cp.get_axis_item("Y-Axis 0") is axis_item
+
+    axis_item.set_axis_name("Renamed Axis")
+
+    assert cp.get_axis_item("Y-Axis 0") is None
+    assert cp.get_axis_item("Renamed Axis") is axis_item
+
+
+def test_curve_list_changed_coalesces_model_refresh(control_panel, qtbot):
+    """Test that a burst of curve_list_changed emissions refreshes the formula model once.
+
+    Parameters
+    ----------
+    control_panel : fixture
+        The ControlPanel from a TraceDisplay instance
+    qtbot : fixture
+        pytest-qt bot used to wait for the refresh timer
+
+    Expectations
+    ------------
+    Several emissions within one event loop pass result in a single reset of
+    the formula dialog's curve model.
+    """
+    resets = []
+    control_panel.formula_dialog.curve_model.modelReset.connect(lambda: resets.append(True))
+
+    for _ in range(5):
+        control_panel.curve_list_changed.emit()
+    assert not resets
+
+    qtbot.waitUntil(lambda: len(resets) > 0)
+    qtbot.wait(10)
+    assert len(resets) == 1
+
+
+def test_close_event_removes_each_axis_item(control_panel_with_axis):
+    """Test that closeEvent removes every AxisItem without confirmation prompts.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    No "delete the axis?" dialog is opened, every axis and its curves are removed
+    from the control panel and the plot, and the control panel's updates are
+    re-enabled afterwards.
+    """
+    cp, axis_item = control_panel_with_axis
+    axis_item.add_curve("PV:1")
+    cp.add_empty_axis("Y-Axis 1")
+
+    with patch.object(QtWidgets.QMessageBox, "exec_", side_effect=AssertionError("closeEvent opened a dialog")):
+        cp.closeEvent(QtGui.QCloseEvent())
+
+    assert cp.get_axis_item("Y-Axis 0") is None
+    assert cp.get_axis_item("Y-Axis 1") is None
+    assert cp.plot._axes == []
+    assert cp.plot._curves == []
+    assert cp.updatesEnabled()
+
+
+def test_axis_close_cancel_keeps_axis(control_panel_with_axis):
+    """Test that cancelling the AxisItem delete prompt keeps the axis.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    close returns False and the axis stays in the control panel and on the plot.
+    """
+    cp, axis_item = control_panel_with_axis
+
+    with patch.object(QtWidgets.QMessageBox, "exec_", return_value=QtWidgets.QMessageBox.Cancel):
+        assert axis_item.close() is False
+
+    assert cp.get_axis_item("Y-Axis 0") is axis_item
+    assert axis_item.source in cp.plot._axes
+
+
+def test_axis_close_removes_only_that_axis_from_plot(control_panel_with_axis):
+    """Test that confirming an AxisItem's delete prompt removes just that axis.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    The closed axis, which is not the newest one, is removed from pydm's axis
+    list and the plot item's axes while the other axes keep their order.
+    """
+    cp, axis_item = control_panel_with_axis
+    cp.add_empty_axis("Y-Axis 1")
+    remaining_axes = [axis for axis in cp.plot._axes if axis is not axis_item.source]
+
+    with patch.object(QtWidgets.QMessageBox, "exec_", return_value=QtWidgets.QMessageBox.Ok):
+        axis_item.close()
+
+    assert cp.plot._axes == remaining_axes
+    assert "Y-Axis 0" not in cp.plot.plotItem.axes
+    assert "Y-Axis 1" in cp.plot.plotItem.axes
+
+
+def test_axis_set_active_and_collapse_apply_to_each_curve_item(control_panel_with_axis):
+    """Test that an AxisItem's active toggle and collapse apply to all of its CurveItems.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    Deactivating the axis unchecks every CurveItem's active toggle, and
+    collapsing the axis hides every CurveItem.
+    """
+    _cp, axis_item = control_panel_with_axis
+    curve_items = [axis_item.add_curve(pv) for pv in ("PV:1", "PV:2")]
+    axis_item.active_toggle.setCheckState(Qt.Checked)
+
+    axis_item.set_active(Qt.Unchecked)
+    assert all(item.active_toggle.checkState() == Qt.Unchecked for item in curve_items)
+    assert not any(item.source.isVisible() for item in curve_items)
+
+    assert axis_item._expanded
+    axis_item.toggle_expand()
+    assert all(item.isHidden() for item in curve_items)
+
+
+def test_plot_found_through_parent_is_cached_until_reparented(qtbot):
+    """Test that ControlPanel.plot caches a plot found through its parents.
+
+    Parameters
+    ----------
+    qtbot : fixture
+        pytest-qt bot used to manage the test widgets
+
+    Expectations
+    ------------
+    The plot is looked up from the parent chain once and reused, and the
+    cached plot is dropped when the control panel is moved to a new parent.
+    """
+    first_parent, second_parent = QtWidgets.QWidget(), QtWidgets.QWidget()
+    first_parent.plot = MagicMock()
+    second_parent.plot = MagicMock()
+    qtbot.addWidget(first_parent)
+    qtbot.addWidget(second_parent)
+
+    cp = ControlPanel()
+    cp.setParent(first_parent)
+    assert cp.plot is first_parent.plot
+    del first_parent.plot
+    assert cp.plot is not None
+
+    cp.setParent(second_parent)
+    assert cp.plot is second_parent.plot
+
+
+def test_handle_range_change_updates_range_line_edits(control_panel_with_axis):
+    """Test that handle_range_change writes the new range into the min/max line edits.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    Both line edits show the range formatted to 3 significant figures, and
+    repeating the same range does not call setText again.
+    """
+    _, axis_item = control_panel_with_axis
+
+    axis_item.handle_range_change(None, (0.123456, 12345.0))
+    assert axis_item.min_range_line_edit.text() == "0.123"
+    assert axis_item.max_range_line_edit.text() == "1.23e+04"
+
+    with patch.object(axis_item.min_range_line_edit, "setText") as mock_set_text:
+        axis_item.handle_range_change(None, (0.123456, 12345.0))
+    mock_set_text.assert_not_called()
+
+
+def test_deleting_curve_hides_dependent_formula(control_panel_with_axis):
+    """Test that closing a CurveItem hides formulas that reference its curve.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    The deleted curve's key is resolved before it is removed from the curve
+    dictionary, the dependent formula's CurveItem is deactivated, and the
+    curve is no longer registered afterwards.
+    """
+    cp, axis_item = control_panel_with_axis
+    pv_item = axis_item.add_curve("PV:1")
+    key = pv_item.variable_name
+    assert cp.curve_key(pv_item.source) == key
+
+    formula_item = axis_item.add_formula_curve(f"f://{{{key}}}+1")
+    formula_item.active_toggle.setCheckState(Qt.Checked)
+
+    pv_item.close()
+
+    assert formula_item.active_toggle.checkState() == Qt.Unchecked
+    assert key not in cp.curve_dict
+    assert cp.curve_key(pv_item.source) is None
+
+
+def test_axis_curve_list_changes_emit_curve_list_changed_once(control_panel_with_axis, qtbot):
+    """Test that a burst of AxisItem curve list changes is forwarded as one signal.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+    qtbot : fixture
+        pytest-qt bot used to wait for the deferred emission
+
+    Expectations
+    ------------
+    curve_list_changed is not emitted synchronously, and is emitted exactly
+    once after control returns to the event loop.
+    """
+    cp, axis_item = control_panel_with_axis
+    emissions = []
+    cp.curve_list_changed.connect(lambda: emissions.append(True))
+
+    for _ in range(4):
+        axis_item.curves_list_changed.emit()
+    assert not emissions
+
+    qtbot.waitUntil(lambda: len(emissions) > 0)
+    qtbot.wait(10)
+    assert len(emissions) == 1
+
+
+def test_curve_item_axis_item_follows_move_to_new_axis(control_panel_with_axis):
+    """Test that CurveItem.axis_item reflects the axis a curve was moved to.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    After moving a CurveItem to another axis, axis_item returns the new
+    AxisItem rather than the cached original one.
+    """
+    cp, axis_item = control_panel_with_axis
+    curve_item = axis_item.add_curve("PV:1")
+    assert curve_item.axis_item is axis_item
+
+    cp.move_curve_to_axis(curve_item, "Other Axis")
+
+    assert curve_item.axis_item is cp.get_axis_item("Other Axis")
+
+
+def test_settings_modal_refreshes_from_curve_when_reshown(control_panel_with_axis):
+    """Test that a reused CurveSettingsModal shows the curve's current settings.
+
+    Parameters
+    ----------
+    control_panel_with_axis : fixture
+        A ControlPanel with an existing axis named 'Y-Axis 0'
+
+    Expectations
+    ------------
+    The modal is created once per CurveItem. Settings changed on the curve
+    while it was hidden are reflected in its inputs the next time it is shown,
+    without those inputs writing back to the curve.
+    """
+    _, axis_item = control_panel_with_axis
+    curve_item = axis_item.add_curve("PV:1")
+    curve_item.show_settings_modal()
+    modal = curve_item.pv_settings_modal
+    modal.hide()
+
+    curve = curve_item.source
+    curve.lineWidth = 4
+    curve.symbolSize = 15
+    curve.liveData = not curve.liveData
+    curve_item.show_settings_modal()
+
+    assert curve_item.pv_settings_modal is modal
+    assert modal.width_combo.currentText() == "4px"
+    assert modal.size_combo.currentText() == "15px"
+    assert modal.live_toggle.isChecked() == curve.liveData
+    assert modal.name_edit.text() == curve.name()
+    modal.hide()
@@ -1,14 +1,26 @@
+import json
 from datetime import datetime
+from collections import OrderedDict
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pandas as pd
 import pytest
-from qtpy.QtCore import Qt, QModelIndex
+from scipy.io import loadmat
+from qtpy.QtCore import Qt, QByteArray, QModelIndex
+from qtpy.QtNetwork import QNetworkReply, QNetworkRequest
+from qtpy.QtWidgets import QHeaderView
 
 from widgets.data_insight_tool import (
     SEVERITY_MAP,
+    FETCH_BATCH_ROWS,
     CAGetThread,
     DataInsightTool,
+    ArchiveParseThread,
     DataVisualizationModel,
+    range_overlap,
+    build_archive_df,
+    archiver_timestamp,
 )
 
 # ---------------------------------------------------------------------------
@@ -132,6 +144,20 @@ def test_set_live_data_filters_by_x_range(model, make_curve):
     assert list(model.df["Value"]) == pytest.approx([2.0, 3.0])
 
 
+def test_set_live_data_is_independent_of_curve_buffer(model, make_curve):
+    """Rows taken from the live buffer must not change when the curve later
+    writes new values into that buffer.
+    """
+    ts = [1_000_000.0, 1_000_001.0]
+    curve = make_curve(ts, [1.0, 2.0])
+    model.set_live_data(curve, (ts[0], ts[-1]))
+
+    curve.data_buffer[1, :] = -1.0
+
+    assert model.data(model.index(0, 1), Qt.DisplayRole) == "1.0"
+    assert list(model.df["Value"]) == pytest.approx([1.0, 2.0])
+
+
 def test_set_live_data_returns_early_when_no_points_accumulated(model, make_curve):
     """set_live_data should return early and leave df empty when points_accumulated == 0."""
     curve = make_curve([], [])
@@ -196,6 +222,20 @@ def test_set_archive_data_converts_secs_nanos_to_datetime(model):
     assert abs((dt_value - datetime.fromtimestamp(ts)).total_seconds()) < 1e-6
 
 
+def test_set_archive_data_datetimes_match_fromtimestamp_across_year(model):
+    """Vectorized datetime conversion must agree with datetime.fromtimestamp for
+    every row, including timestamps on either side of a DST transition.
+    """
+    # One timestamp per month of 2024
+    ts = [1_704_067_200.25 + month * 30 * 86_400 for month in range(12)]
+    data_dict = _make_archive_dict(ts, [0.0] * len(ts))
+
+    model.set_archive_data(data_dict)
+
+    for dt_value, expected in zip(model.df["Datetime"], ts):
+        assert abs((dt_value - datetime.fromtimestamp(expected)).total_seconds()) < 1e-6
+
+
 def test_set_archive_data_maps_severity(model):
     """Severity integers should be mapped through SEVERITY_MAP."""
     ts = [1_000_000.0, 1_000_001.0, 1_000_002.0, 1_000_003.0]
@@ -232,11 +272,324 @@ def test_set_archive_data_with_empty_data_does_not_modify_df(model, make_curve):
     assert model.df.shape[0] == 1
 
 
+@pytest.mark.parametrize(
+    ("values", "expected_kind"),
+    (
+        ([1.5, 2], "f"),
+        ([1, 2], "i"),
+        (["on", "off"], "O"),
+        ([[1, 2], [3, 4]], "O"),
+    ),
+)
+def test_build_archive_df_value_dtype(values, expected_kind):
+    """Test that build_archive_df keeps archived values with a matching dtype.
+
+    Parameters
+    ----------
+    values : list
+        The archived values in the reply
+    expected_kind : str
+        The expected numpy dtype kind of the Value column
+
+    Expectations
+    ------------
+    Float values are stored as float64, other scalars and waveforms keep the dtype
+    pandas infers, and the values themselves are unchanged.
+    """
+    archive_df = build_archive_df(_make_archive_dict([1_000_000.0, 1_000_001.0], values))
+
+    assert archive_df["Value"].dtype.kind == expected_kind
+    assert archive_df["Value"].tolist() == values
+
+
+def test_archive_parse_thread_accepts_nan_values():
+    """Replies holding bare NaN literals, as the archiver sends for NaN values,
+    should be parsed rather than dropped as undecodable.
+    """
+    reply_body = b'[{"data": [{"secs": 1000000, "nanos": 0, "val": NaN, "severity": 0}]}]'
+    thread = ArchiveParseThread(reply_bytes=reply_body, cache_key=("FAKE:PV", 0.0, 1.0))
+    results = []
+    thread.result_ready.connect(results.append)
+
+    thread.run()
+
+    assert len(results) == 1 and results[0] is not None
+    assert np.isnan(results[0]["Value"].iloc[0])
+    assert thread.cache_key is not None
+
+
+@pytest.mark.parametrize(
+    "reply_body",
+    [
+        b"not json",
+        b"[]",
+        b'[{"meta": {}}]',
+        b'[{"data": [{"secs": "x", "nanos": 0, "val": 1.0}]}]',
+    ],
+)
+def test_archive_parse_thread_emits_none_for_bad_replies(reply_body):
+    """Replies that can't be decoded or don't hold archive rows should still
+    emit a result so the loading state clears, and should not be cached.
+
+    Parameters
+    ----------
+    reply_body : bytes
+        The raw body of the archiver's reply
+
+    Expectations
+    ------------
+    result_ready is emitted once with None, the cache key is dropped, and
+    the reply body is released.
+    """
+    thread = ArchiveParseThread(reply_bytes=reply_body, cache_key=("FAKE:PV", 0.0, 1.0))
+    results = []
+    thread.result_ready.connect(results.append)
+
+    thread.run()
+
+    assert results == [None]
+    assert thread.cache_key is None
+    assert thread.reply_bytes is None
+
+
+def test_finished_archive_parse_thread_is_released(model, qtbot):
+    """A parse thread should be deleted and its reply body dropped once it
+    finishes, so replies don't accumulate on the long-lived model.
+    """
+    reply = _make_reply(_make_archive_dict([1_000_000.0], [1.0]))
+    model.archive_reply = reply
+    model.recieve_archive_reply(reply)
+    thread = model.archive_parse_thread
+
+    with qtbot.waitSignal(thread.destroyed, timeout=2000):
+        qtbot.waitUntil(lambda: model.archive_parse_thread is None, timeout=2000)
+
+    assert model.df.shape[0] == 1
+
+
+def test_build_archive_df_keeps_nanosecond_timestamps():
+    """Archived timestamps should keep their exact nanoseconds rather than being
+    rounded through float seconds.
+    """
+    data_dict = [{"data": [{"secs": 1_700_000_000, "nanos": 123_456_789, "val": 1.0, "severity": 0}]}]
+
+    archive_df = build_archive_df(data_dict)
+
+    assert archive_df["Datetime"].iloc[0].nanosecond == 789
+    assert archive_df["Datetime"].iloc[0].microsecond == 123_456
+
+
+def _make_reply(data_dict):
+    """Build a successful QNetworkReply mock whose body is the given archive dict."""
+    reply = MagicMock()
+    reply.error.return_value = QNetworkReply.NoError
+    reply.readAll.return_value = QByteArray(json.dumps(data_dict).encode("utf-8"))
+    reply.request.return_value.attribute.return_value = None
+    return reply
+
+
+def test_recieve_archive_reply_parses_reply_bytes(model, qtbot):
+    """recieve_archive_reply should parse the raw reply bytes off the GUI thread,
+    populate the df, and then emit reply_recieved.
+    """
+    reply = _make_reply(_make_archive_dict([1_000_000.0, 1_000_001.0], [1.0, 2.0]))
+    model.archive_reply = reply
+
+    with qtbot.waitSignal(model.reply_recieved, timeout=2000):
+        model.recieve_archive_reply(reply)
+    qtbot.waitUntil(lambda: model.archive_parse_thread is None, timeout=2000)
+
+    assert model.df.shape[0] == 2
+    assert list(model.df["Value"]) == pytest.approx([1.0, 2.0])
+    reply.deleteLater.assert_called_once()
+
+
+def test_archive_reply_body_is_read_as_it_arrives(model, qtbot):
+    """Chunks drained from the reply on readyRead should be joined with the rest
+    of the body when the reply finishes.
+    """
+    body = json.dumps(_make_archive_dict([1_000_000.0, 1_000_001.0], [1.0, 2.0])).encode("utf-8")
+    reply = _make_reply([])
+    reply.readAll.side_effect = [QByteArray(body[:10]), QByteArray(body[10:])]
+    model.archive_reply = reply
+
+    with patch.object(model, "sender", return_value=reply):
+        model.read_archive_reply()
+    with qtbot.waitSignal(model.reply_recieved, timeout=2000):
+        model.recieve_archive_reply(reply)
+    qtbot.waitUntil(lambda: model.archive_parse_thread is None, timeout=2000)
+
+    assert list(model.df["Value"]) == pytest.approx([1.0, 2.0])
+
+
+def test_reply_for_earlier_request_is_ignored(model, qtbot):
+    """A reply that is not for the current request should be released without
+    being parsed or signalling the parent widget.
+    """
+    stale_reply = _make_reply(_make_archive_dict([1_000_000.0], [1.0]))
+    model.archive_reply = _make_reply(_make_archive_dict([1_000_001.0], [2.0]))
+
+    with qtbot.assertNotEmitted(model.reply_recieved):
+        model.recieve_archive_reply(stale_reply)
+
+    assert model.archive_parse_thread is None
+    stale_reply.deleteLater.assert_called_once()
+
+
+def test_set_all_data_aborts_in_flight_reply(model, make_curve):
+    """Starting a new request should abort the reply still in flight for the previous one."""
+    in_flight = _make_reply(_make_archive_dict([1_000_000.0], [1.0]))
+    in_flight.isRunning.return_value = True
+    model.archive_reply = in_flight
+
+    ts = [2_000_000.0, 2_000_001.0]
+    with patch.object(CAGetThread, "start"):
+        model.set_all_data(make_curve(ts, [5.0, 6.0]), (ts[0], ts[-1]))
+
+    in_flight.abort.assert_called_once()
+    assert model.archive_reply is None
+
+
+def test_stale_archive_parse_result_is_discarded(model, make_curve, qtbot):
+    """A reply still being parsed when set_all_data resets the model must not
+    leak its rows into the new data.
+    """
+    reply = _make_reply(_make_archive_dict([1_000_000.0], [1.0]))
+    model.archive_reply = reply
+    model.recieve_archive_reply(reply)
+    stale_thread = model.archive_parse_thread
+
+    ts = [2_000_000.0, 2_000_001.0]
+    with patch.object(CAGetThread, "start"):
+        model.set_all_data(make_curve(ts, [5.0, 6.0]), (ts[0], ts[-1]))
+    stale_thread.wait()
+    qtbot.wait(50)
+
+    assert model.df.shape[0] == 2
+    assert all(model.df["Source"] == "Live")
+
+
+def test_df_concatenates_frames_in_display_order(model, make_curve):
+    """df should join the archive and live rows in display order, and reuse
+    the joined frame until the data changes again.
+    """
+    model.set_live_data(make_curve([1_000_002.0], [3.0]), (1_000_002.0, 1_000_002.0))
+    model.set_archive_data(_make_archive_dict([1_000_000.0, 1_000_001.0], [1.0, 2.0]))
+
+    df = model.df
+
+    assert list(df["Value"]) == pytest.approx([1.0, 2.0, 3.0])
+    assert list(df["Source"]) == ["Archive", "Archive", "Live"]
+    assert model.df is df
+
+    model.set_archive_data(_make_archive_dict([999_999.0], [0.0]))
+
+    assert model.df is not df
+    assert model.rowCount() == 4
+
+
+def test_request_archive_data_uses_covering_cached_range(model, monkeypatch):
+    """A request inside a previously fetched range should be served from the
+    cache, inserting only the rows within the requested range.
+    """
+    monkeypatch.setenv("PYDM_ARCHIVER_URL", "http://archiver.invalid")
+    ts = [1_000_000.0, 1_000_001.0, 1_000_002.0, 1_000_003.0]
+    model.cache_archive_df(("FAKE:PV", ts[0], ts[-1]), build_archive_df(_make_archive_dict(ts, [1.0, 2.0, 3.0, 4.0])))
+
+    with patch.object(model.network_manager, "get") as mock_get:
+        model.request_archive_data("FAKE:PV", (ts[1], ts[2]))
+        mock_get.assert_not_called()
+
+        model.request_archive_data("FAKE:PV", (ts[1], ts[-1] + 1))
+        model.request_archive_data("OTHER:PV", (ts[1], ts[2]))
+        assert mock_get.call_count == 2
+
+    assert list(model.df["Value"]) == pytest.approx([2.0, 3.0])
+
+
+def test_request_archive_data_allows_connection_reuse(model, monkeypatch):
+    """Archive requests should allow HTTP/2 and pipelining and carry their PV and range."""
+    monkeypatch.setenv("PYDM_ARCHIVER_URL", "http://archiver.invalid")
+
+    with patch.object(model.network_manager, "get") as mock_get:
+        model.request_archive_data("FAKE:PV", (1_000_000.0, 1_000_001.0))
+
+    request = mock_get.call_args.args[0]
+    assert request.attribute(QNetworkRequest.Http2AllowedAttribute) is True
+    assert request.attribute(QNetworkRequest.HttpPipeliningAllowedAttribute) is True
+    assert request.attribute(QNetworkRequest.User) == ("FAKE:PV", 1_000_000.0, 1_000_001.0)
+    assert model.network_manager.transferTimeout() == 0
+
+
+@pytest.mark.parametrize(
+    "timestamp, expected",
+    [
+        (0.0, "1970-01-01T00:00:00.000Z"),
+        (1_000_000_000.5, "2001-09-09T01:46:40.500Z"),
+        (1_704_067_199.9999, "2023-12-31T23:59:59.999Z"),
+    ],
+)
+def test_archiver_timestamp_format(timestamp, expected):
+    """archiver_timestamp should produce UTC ISO 8601 strings truncated to milliseconds.
+
+    Parameters
+    ----------
+    timestamp : float
+        Seconds since the epoch to format
+    expected : str
+        The string the Archiver Appliance expects
+
+    Expectations
+    ------------
+    The formatted string matches the expected archiver format.
+    """
+    assert archiver_timestamp(timestamp) == expected
+
+
+def test_archive_cache_evicts_least_recently_used(model, monkeypatch):
+    """The cache should drop the least recently used ranges once it holds too many rows."""
+    monkeypatch.setattr("widgets.data_insight_tool.ARCHIVE_CACHE_MAX_ROWS", 3)
+    for i in range(3):
+        ts = [1_000_000.0 + 10 * i, 1_000_001.0 + 10 * i]
+        model.cache_archive_df(("FAKE:PV", ts[0], ts[-1]), build_archive_df(_make_archive_dict(ts, [0.0, 0.0])))
+
+    assert list(model._archive_cache) == [("FAKE:PV", 1_000_020.0, 1_000_021.0)]
+
+
 # ---------------------------------------------------------------------------
 # DataVisualizationModel — set_all_data (reset before populating)
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.parametrize(
+    "range_a, range_b, expected",
+    [
+        ((0.0, 10.0), (5.0, 15.0), (5.0, 10.0)),
+        ((5.0, 15.0), (0.0, 10.0), (5.0, 10.0)),
+        ((0.0, 10.0), (2.0, 3.0), (2.0, 3.0)),
+        ((0.0, 5.0), (5.0, 10.0), (5.0, 5.0)),
+        ((0.0, 4.0), (5.0, 10.0), None),
+    ],
+)
+def test_range_overlap(range_a, range_b, expected):
+    """range_overlap should return the closed intersection of two ranges, or None.
+
+    Parameters
+    ----------
+    range_a : tuple[float, float]
+        The first range
+    range_b : tuple[float, float]
+        The second range
+    expected : tuple[float, float] | None
+        The expected intersection
+
+    Expectations
+    ------------
+    The intersection matches the expected range, including touching endpoints.
+    """
+    assert range_overlap(range_a, range_b) == expected
+
+
 def test_set_all_data_resets_model_before_populating(model, make_curve):
     """set_all_data should clear any stale data before populating with new data.
 
@@ -258,6 +611,65 @@ def test_set_all_data_resets_model_before_populating(model, make_curve):
     assert all(model.df["Source"] == "Live")
 
 
+def test_set_all_data_reuses_connected_description_pv(model, make_curve, monkeypatch):
+    """set_all_data should read the description from an already connected
+    cached PV instead of starting a new CAGetThread.
+    """
+    desc_pv = MagicMock(connected=True, value="Cached description")
+    monkeypatch.setitem(CAGetThread.pv_cache, "FAKE:PV.DESC", desc_pv)
+    ts = [1_000_000.0, 1_000_001.0]
+
+    with patch.object(CAGetThread, "start") as mock_start:
+        model.set_all_data(make_curve(ts, [1.0, 2.0]), (ts[0], ts[-1]))
+
+    mock_start.assert_not_called()
+    assert model.description == "Cached description"
+
+
+def test_ca_get_thread_evicts_least_recently_used_pv(monkeypatch):
+    """Once more than PV_CACHE_MAX_SIZE channels are cached, the least recently
+    used one should be dropped and disconnected.
+    """
+    monkeypatch.setattr(CAGetThread, "pv_cache", OrderedDict())
+    monkeypatch.setattr("widgets.data_insight_tool.PV_CACHE_MAX_SIZE", 2)
+
+    with patch("widgets.data_insight_tool.epics.PV") as mock_pv_cls:
+        mock_pv_cls.side_effect = lambda address, **_: MagicMock(address=address)
+        for address in ("A.DESC", "B.DESC"):
+            CAGetThread(address=address).run()
+        evicted_pv = CAGetThread.pv_cache["B.DESC"]
+        CAGetThread.cached_pv("A.DESC")
+        CAGetThread(address="C.DESC").run()
+
+    assert list(CAGetThread.pv_cache) == ["A.DESC", "C.DESC"]
+    evicted_pv.disconnect.assert_called_once()
+
+
+def test_ca_get_thread_keeps_pv_cached_by_another_thread(monkeypatch):
+    """If another thread caches the same address while a PV is being created,
+    the cached PV should be kept and the duplicate disconnected.
+    """
+    monkeypatch.setattr(CAGetThread, "pv_cache", OrderedDict())
+    cached_pv = MagicMock(value="Cached description")
+    duplicate_pv = MagicMock()
+
+    def create_pv(address, **_):
+        # Simulate another CAGetThread caching the address first
+        CAGetThread.pv_cache[address] = cached_pv
+        return duplicate_pv
+
+    thread = CAGetThread(address="A.DESC")
+    results = []
+    thread.result_ready.connect(results.append)
+    with patch("widgets.data_insight_tool.epics.PV", side_effect=create_pv):
+        thread.run()
+
+    assert CAGetThread.pv_cache["A.DESC"] is cached_pv
+    assert results == ["Cached description"]
+    duplicate_pv.disconnect.assert_called_once()
+    cached_pv.disconnect.assert_not_called()
+
+
 def test_set_all_data_emits_reply_received_when_no_archive_needed(model, make_curve, qtbot):
     """reply_recieved should be emitted when x_range[0] > curve_range[0] (no archive request)."""
     # curve_range: [1_000_000, 1_000_002]; shift x_range start past curve_range[0]
@@ -282,7 +694,84 @@ def test_set_all_data_requests_archive_data_when_x_range_precedes_curve(model, m
     with patch.object(CAGetThread, "start"), patch.object(model, "request_archive_data") as mock_request:
         model.set_all_data(curve, x_range)
 
-    mock_request.assert_called_once_with(curve.address, expected_archive_range)
+    mock_request.assert_called_once_with(curve.address, expected_archive_range, use_cache=True)
+
+
+# ---------------------------------------------------------------------------
+# DataVisualizationModel — export_data
+# ---------------------------------------------------------------------------
+
+
+def test_export_csv_writes_header_and_rows_without_mutating_df(model, tmp_path):
+    """CSV export should write the metadata header and one row per point in
+    epoch seconds, leaving the model's dataframe untouched.
+    """
+    ts = [1_000_000.0, 1_000_001.5]
+    model.address, model.unit, model.description = "FAKE:PV", "eV", "A fake PV"
+    model.set_archive_data(_make_archive_dict(ts, [1.0, 2.0]))
+    datetime_dtype = model.df["Datetime"].dtype
+
+    file_path = tmp_path / "export.csv"
+    model.export_data(file_path, ".csv")
+
+    lines = file_path.read_text().splitlines()
+    assert lines[:3] == ["Address: FAKE:PV", "Unit: eV", "Description: A fake PV"]
+    assert lines[3] == "Datetime,Value,Severity,Source"
+    assert len(lines) == 6
+    assert lines[4].split(",")[1:] == ["1.0", "NO_ALARM", "Archive"]
+    exported_secs = [float(line.split(",")[0]) for line in lines[4:]]
+    assert exported_secs[1] - exported_secs[0] == pytest.approx(1.5)
+    assert model.df["Datetime"].dtype == datetime_dtype
+
+
+def test_export_mat_round_trips_columns(model, tmp_path):
+    """MAT export should write the metadata and columns in a file scipy can read back."""
+    ts = [1_000_000.0, 1_000_001.5]
+    model.address, model.unit, model.description = "FAKE:PV", "eV", "A fake PV"
+    model.set_archive_data(_make_archive_dict(ts, [1.0, 2.0]))
+
+    file_path = tmp_path / "export.mat"
+    model.export_data(file_path, ".mat")
+
+    exported = loadmat(file_path)
+    assert exported["Address"][0] == "FAKE:PV"
+    assert exported["Value"].ravel() == pytest.approx([1.0, 2.0])
+    assert np.diff(exported["Datetime"].ravel()) == pytest.approx([1.5])
+
+
+def test_export_json_writes_meta_and_records(model, tmp_path):
+    """JSON export should write the metadata and one record per point with
+    display names for the coded columns.
+    """
+    ts = [1_000_000.0, 1_000_001.5]
+    model.address, model.unit, model.description = "FAKE:PV", "eV", "A fake PV"
+    model.set_archive_data(_make_archive_dict(ts, [1.0, 2.0]))
+
+    file_path = tmp_path / "export.json"
+    model.export_data(file_path, ".json")
+
+    exported = json.loads(file_path.read_bytes())
+    assert exported["meta"] == {"Address": "FAKE:PV", "Unit": "eV", "Description": "A fake PV"}
+    assert [record["Value"] for record in exported["data"]] == [1.0, 2.0]
+    assert {record["Source"] for record in exported["data"]} == {"Archive"}
+    assert exported["data"][1]["Datetime"] - exported["data"][0]["Datetime"] == pytest.approx(1.5)
+
+
+def test_export_json_writes_non_finite_values_as_null(model, tmp_path):
+    """JSON export should write NaN and infinite values as null, formatted
+    exactly as the stdlib json fallback would write them.
+    """
+    ts = [1_000_000.0, 1_000_001.0, 1_000_002.0]
+    model.address, model.unit, model.description = "FAKE:PV", "\u00b5A", "A fake PV"
+    model.set_archive_data(_make_archive_dict(ts, [1.0, float("nan"), float("inf")]))
+
+    file_path = tmp_path / "export.json"
+    model.export_data(file_path, ".json")
+    exported = file_path.read_bytes()
+
+    parsed = json.loads(exported)
+    assert [record["Value"] for record in parsed["data"]] == [1.0, None, None]
+    assert exported == json.dumps(parsed, indent=2, ensure_ascii=False, allow_nan=False).encode()
 
 
 # ---------------------------------------------------------------------------
@@ -305,6 +794,114 @@ def test_data_returns_string_for_display_role(model, make_curve):
     assert model.data(value_index, Qt.DisplayRole) == "42.0"
 
 
+def test_data_follows_rows_after_archive_prepend(model, make_curve):
+    """data() should reflect the current df after archive rows are prepended to live rows."""
+    model.set_live_data(make_curve([1_000_001.0], [42.0]), (1_000_001.0, 1_000_001.0))
+    model.set_archive_data(_make_archive_dict([1_000_000.0], [7.0]))
+
+    for row in range(model.rowCount()):
+        for col in range(1, model.columnCount()):
+            assert model.data(model.index(row, col), Qt.DisplayRole) == str(model.df.iat[row, col])
+    assert model.data(model.index(0, 3), Qt.DisplayRole) == "Archive"
+    assert model.data(model.index(1, 1), Qt.DisplayRole) == "42.0"
+
+
+def test_data_formats_datetime_with_microseconds(model):
+    """The Datetime column should display with a fixed microsecond precision."""
+    ts = 1_000_000.25
+    model.set_archive_data(_make_archive_dict([ts], [1.0]))
+
+    displayed = model.data(model.index(0, 0), Qt.DisplayRole)
+
+    assert displayed == datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def test_severity_and_source_display_names_from_codes(model, make_curve):
+    """Severity and Source should be displayed and exported by name even though
+    they are stored as small integer codes.
+    """
+    model.set_live_data(make_curve([1_000_001.0], [1.0]), (1_000_001.0, 1_000_001.0))
+    model.set_archive_data(_make_archive_dict([1_000_000.0], [2.0], severities=[2]))
+
+    assert model.data(model.index(0, 2), Qt.DisplayRole) == "MAJOR"
+    assert model.data(model.index(0, 3), Qt.DisplayRole) == "Archive"
+    assert model.data(model.index(1, 2), Qt.DisplayRole) == "NaN"
+    assert model.data(model.index(1, 3), Qt.DisplayRole) == "Live"
+    assert list(model.df["Severity"]) == ["MAJOR", "NaN"]
+    assert isinstance(model.df["Severity"].dtype, pd.CategoricalDtype)
+    assert isinstance(model.df["Source"].dtype, pd.CategoricalDtype)
+
+
+def test_data_decodes_waveform_values_on_request(model):
+    """Waveform values are formatted when displayed, so toggling decode_as_string
+    changes how they are shown while numeric values keep their preformatted text.
+    """
+    model.set_archive_data(_make_archive_dict([1_000_000.0], [[72, 105, 0]]))
+    value_index = model.index(0, 1)
+
+    assert model.data(value_index, Qt.DisplayRole) == "[72, 105, 0]"
+    model.decode_as_string = True
+    assert model.data(value_index, Qt.DisplayRole) == "Hi"
+
+
+def test_rows_are_exposed_in_fetch_batches(model, make_curve):
+    """Only the first FETCH_BATCH_ROWS rows are exposed to views until more are
+    fetched, including after archive rows are prepended, while df keeps every row.
+    """
+    live_ts = [2_000_000.0 + i for i in range(FETCH_BATCH_ROWS - 10)]
+    model.set_live_data(make_curve(live_ts, [1.0] * len(live_ts)), (live_ts[0], live_ts[-1]))
+    assert model.rowCount() == len(live_ts)
+    assert not model.canFetchMore(QModelIndex())
+
+    archive_ts = [1_000_000.0 + i for i in range(FETCH_BATCH_ROWS)]
+    model.set_archive_data(_make_archive_dict(archive_ts, [2.0] * len(archive_ts)))
+    assert model.rowCount() == FETCH_BATCH_ROWS
+    assert model.df.shape[0] == len(live_ts) + len(archive_ts)
+    assert model.data(model.index(0, 3), Qt.DisplayRole) == "Archive"
+
+    assert model.canFetchMore(QModelIndex())
+    assert model.canFetchMore()
+    # Table rows have no children to fetch
+    assert not model.canFetchMore(model.index(0, 0))
+    model.fetchMore(QModelIndex())
+    assert model.rowCount() == model.df.shape[0]
+    assert not model.canFetchMore(QModelIndex())
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    (
+        ([1.0, 2.0], False),
+        (["on", "off"], False),
+        ([[72, 105], [0, 0]], True),
+    ),
+)
+def test_has_waveform_data_reads_frames(model, make_curve, values, expected):
+    """Test that has_waveform_data detects array values without assembling the df.
+
+    Parameters
+    ----------
+    model : fixture
+        Instance of DataVisualizationModel
+    make_curve : fixture
+        Factory for mock live curves
+    values : list
+        The archived values added ahead of one live row
+    expected : bool
+        Whether the values include waveforms
+
+    Expectations
+    ------------
+    has_waveform_data reports whether any frame holds list or array values, and
+    the model's df is not built to answer.
+    """
+    model.set_live_data(make_curve([1_000_010.0], [1.0]), (1_000_010.0, 1_000_010.0))
+    model.set_archive_data(_make_archive_dict([1_000_000.0, 1_000_001.0], values))
+
+    assert model.has_waveform_data() is expected
+    assert model._df is None
+
+
 def test_data_returns_none_for_invalid_index(model):
     """data() should return None when given an invalid QModelIndex."""
     assert model.data(QModelIndex()) is None
@@ -315,6 +912,35 @@ def test_data_returns_none_for_invalid_index(model):
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.parametrize(
+    ("extension_filter", "expected_extension"),
+    (
+        ("Comma-Separated Values File (*.csv)", ".csv"),
+        ("MAT-File (*.mat)", ".mat"),
+        ("JSON File (*.json)", ".json"),
+    ),
+)
+def test_export_data_to_file_uses_selected_extension(dit, tmp_path, extension_filter, expected_extension):
+    """The extension of the chosen file dialog filter should be applied to the file name
+    and passed on to the model's export.
+    """
+    file_name = str(tmp_path / "export")
+    with (
+        patch("widgets.data_insight_tool.QFileDialog.getSaveFileName", return_value=(file_name, extension_filter)),
+        patch.object(dit.data_vis_model, "export_data") as mock_export,
+    ):
+        dit.export_data_to_file()
+
+    mock_export.assert_called_once_with(tmp_path / f"export{expected_extension}", expected_extension)
+
+
+def test_data_table_uses_fixed_row_heights(dit):
+    """Both halves of the data table use fixed, unwrapped rows."""
+    for table in (dit.data_table, dit.data_table.frozenTableView):
+        assert table.verticalHeader().sectionResizeMode(0) == QHeaderView.Fixed
+        assert not table.wordWrap()
+
+
 def test_show_loads_data_on_first_open(dit):
     """show() should call get_data() when unopened is True and there is ≥1 PV."""
     with patch.object(dit, "get_data") as mock_get:
@@ -351,6 +977,59 @@ def test_show_does_not_load_data_when_no_pvs(dit):
     assert dit.unopened is True
 
 
+# ---------------------------------------------------------------------------
+# DataInsightTool — request throttling
+# ---------------------------------------------------------------------------
+
+
+def test_request_data_throttles_bursts(dit, qtbot):
+    """A burst of request_data calls should run get_data once immediately and
+    once more with the latest index when the throttle interval ends.
+    """
+    with patch.object(dit, "get_data") as mock_get:
+        dit.request_data(0)
+        dit.request_data(1)
+        dit.request_data(2)
+
+        mock_get.assert_called_once_with(0)
+
+        qtbot.waitUntil(lambda: mock_get.call_count == 2, timeout=1000)
+        mock_get.assert_called_with(2)
+
+
+def test_get_data_hides_loading_label_on_cache_hit(dit):
+    """A request served from the archive cache is recieved immediately, so the
+    loading label should not be left showing afterwards.
+    """
+    dit.data_vis_model.cache_archive_df(("FAKE:PV", -1.0, 1.0), None)
+    dit.pv_select_box.blockSignals(True)
+    dit.pv_select_box.addItem("FAKE:PV")
+    dit.pv_select_box.blockSignals(False)
+
+    with patch.object(dit.data_vis_model.network_manager, "get") as mock_get:
+        dit.get_data(0)
+
+    mock_get.assert_not_called()
+    assert not dit.loading_label.isVisibleTo(dit)
+
+
+def test_refresh_data_skips_archive_cache(dit, monkeypatch):
+    """The Refresh Data button should request archive data again even when a
+    previous reply covers the range, and keep the loading label up until it arrives.
+    """
+    monkeypatch.setenv("PYDM_ARCHIVER_URL", "http://archiver.invalid")
+    dit.data_vis_model.cache_archive_df(("FAKE:PV", -1.0, 1.0), None)
+    dit.pv_select_box.blockSignals(True)
+    dit.pv_select_box.addItem("FAKE:PV")
+    dit.pv_select_box.blockSignals(False)
+
+    with patch.object(dit.data_vis_model.network_manager, "get") as mock_get:
+        dit.refresh_button.click()
+
+    mock_get.assert_called_once()
+    assert dit.loading_label.isVisibleTo(dit)
+
+
 # ---------------------------------------------------------------------------
 # DataInsightTool — update_pv_select_box signal-blocking fix
 # ---------------------------------------------------------------------------
@@ -396,3 +1075,64 @@ def test_update_pv_select_box_skips_non_archive_curves(dit):
 
     assert dit.pv_select_box.count() == 1
     assert dit.pv_select_box.itemText(0) == "ARCHIVE:PV"
+
+
+def test_update_pv_select_box_keeps_selection(dit):
+    """The selected PV should stay selected when other curves are added, and an
+    unchanged curve list should leave the combobox untouched.
+    """
+    from pydm.widgets.archiver_time_plot import ArchivePlotCurveItem
+
+    curves = []
+    for address in ("FAKE:PV1", "FAKE:PV2"):
+        curves.append(MagicMock(spec=ArchivePlotCurveItem))
+        curves[-1].address = address
+    dit._plot._curves = curves[:]
+    dit.update_pv_select_box()
+    dit.pv_select_box.blockSignals(True)
+    dit.pv_select_box.setCurrentIndex(1)
+    dit.pv_select_box.blockSignals(False)
+
+    new_curve = MagicMock(spec=ArchivePlotCurveItem)
+    new_curve.address = "FAKE:PV0"
+    dit._plot._curves = [new_curve] + curves
+    dit.update_pv_select_box()
+
+    assert dit.pv_select_box.count() == 3
+    assert dit.pv_select_box.currentText() == "FAKE:PV2"
+
+    with patch.object(dit.pv_select_box, "clear") as mock_clear:
+        dit.update_pv_select_box()
+    mock_clear.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("received", "total", "expected_text"),
+    (
+        (0, 2_000, "Loading... 0%"),
+        (500, 2_000, "Loading... 25%"),
+        (2_500_000, -1, "Loading... 2.5 MB"),
+    ),
+)
+def test_reply_progress_updates_loading_label(dit, received, total, expected_text):
+    """Test that download progress of the archiver reply is shown in the loading label.
+
+    Parameters
+    ----------
+    dit : fixture
+        Instance of DataInsightTool
+    received : int
+        Bytes of the reply received so far
+    total : int
+        Size of the reply in bytes, -1 if unknown
+    expected_text : str
+        The expected text of the loading label
+
+    Expectations
+    ------------
+    The model's reply_progress signal updates the loading label with a percentage
+    when the reply size is known, and the amount received otherwise.
+    """
+    dit.data_vis_model.reply_progress.emit(received, total)
+
+    assert dit.loading_label.text() == expected_text
@@ -1,2 +1,2 @@
-from .formula_validation import validate_formula, sanitize_for_validation
+from .formula_validation import VAR_PLACEHOLDER_RE, validate_formula, sanitize_for_validation
 from .time_parser import IOTimeParser
@@ -2,9 +2,12 @@ import re
 import ast
 import math
 from typing import Set
+from functools import lru_cache
 
 _ALLOWED_FUNC_NAMES: Set[str] = {*vars(math).keys(), "mean", "ln"}
 
+VAR_PLACEHOLDER_RE = re.compile(r"\{([^}]+)\}")
+
 _ALLOWED_NODES = (
     ast.Expression,
     ast.Constant,
@@ -25,6 +28,25 @@ _ALLOWED_NODES = (
 )
 
 
+@lru_cache(maxsize=128)
+def _parse_formula(expr: str) -> tuple[ast.AST, ...]:
+    """Parse an expression and return all of its AST nodes. Cached so a
+    formula that is validated repeatedly is only parsed once; callers must
+    not modify the returned nodes.
+
+    Parameters
+    ----------
+    expr : str
+        The expression to parse
+
+    Returns
+    -------
+    tuple[ast.AST, ...]
+        Every node in the parsed expression tree, in ast.walk order
+    """
+    return tuple(ast.walk(ast.parse(expr, mode="eval")))
+
+
 def validate_formula(expr: str, allowed_symbols: Set[str]) -> None:
     """Validate a mathematical formula expression for safety and correctness.
 
@@ -47,9 +69,7 @@ def validate_formula(expr: str, allowed_symbols: Set[str]) -> None:
     SyntaxError
         If the expression is not syntactically valid Python
     """
-    tree = ast.parse(expr, mode="eval")
-
-    for node in ast.walk(tree):
+    for node in _parse_formula(expr):
         if not isinstance(node, _ALLOWED_NODES):
             raise ValueError(f'Operator "{type(node).__name__}" not allowed')
 
@@ -94,5 +114,5 @@ def sanitize_for_validation(expr: str) -> tuple[str, set[str]]:
             mapping[var] = f"v{len(mapping)}"
         return mapping[var]
 
-    python_expr = re.sub(r"{([^}]+)}", _repl, expr)
+    python_expr = VAR_PLACEHOLDER_RE.sub(_repl, expr)
     return python_expr, set(mapping.values())
@@ -6,6 +6,7 @@ from qtpy.QtGui import QDrag, QKeyEvent
 from qtpy.QtCore import (
     Qt,
     QUrl,
+    Slot,
     Signal,
     QObject,
     QMimeData,
@@ -62,7 +63,7 @@ class ArchiveResultsTableModel(QAbstractTableModel):
             return 0
         return len(self.column_names)
 
-    def data(self, index: QModelIndex, role: int) -> Any:
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
         """Return the data for the associated role. Currently only supporting DisplayRole."""
         if not index.isValid():
             return None
@@ -89,24 +90,22 @@ class ArchiveResultsTableModel(QAbstractTableModel):
         self.beginInsertRows(QModelIndex(), len(self.results_list), len(self.results_list))
         self.results_list.append(pv)
         self.endInsertRows()
-        self.layoutChanged.emit()
 
     def replace_rows(self, pvs: list[str]) -> None:
         """Overwrites any existing rows in the table with the input list of PV names"""
-        self.beginInsertRows(QModelIndex(), 0, len(pvs) - 1)
+        self.beginResetModel()
         self.results_list = pvs
-        self.endInsertRows()
-        self.layoutChanged.emit()
+        self.endResetModel()
 
     def clear(self) -> None:
         """Clear out all data stored in this table"""
-        self.beginRemoveRows(QModelIndex(), 0, len(self.results_list))
+        self.beginResetModel()
         self.results_list = []
-        self.endRemoveRows()
-        self.layoutChanged.emit()
+        self.endResetModel()
 
     def sort(self, col: int, order=Qt.AscendingOrder) -> None:
         """Sort the table by PV name"""
+        self.layoutAboutToBeChanged.emit()
         self.results_list.sort(reverse=order == Qt.DescendingOrder)
         self.layoutChanged.emit()
 
@@ -180,11 +179,11 @@ class ArchiveSearchWidget(QWidget):
         self.results_view.verticalHeader().setVisible(False)
         self.results_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         # self.results_view.startDrag = self.startDragAction
-        self.results_view.doubleClicked.connect(lambda: self.append_PVs_requested.emit(self.selectedPVs()))
+        self.results_view.doubleClicked.connect(self.request_selected_pvs)
         self.main_layout.addWidget(self.results_view)
 
         self.insert_button = QPushButton("Add PVs")
-        self.insert_button.clicked.connect(lambda: self.append_PVs_requested.emit(self.selectedPVs()))
+        self.insert_button.clicked.connect(self.request_selected_pvs)
         self.main_layout.addWidget(self.insert_button)
 
         self.setLayout(self.main_layout)
@@ -203,6 +202,11 @@ class ArchiveSearchWidget(QWidget):
             pv_list.append(self.results_table_model.results_list[index.row()])
         return pv_list
 
+    @Slot()
+    def request_selected_pvs(self) -> None:
+        """Emit append_PVs_requested with the PVs selected in the results table."""
+        self.append_PVs_requested.emit(self.selectedPVs())
+
     def startDragAction(self, supported_actions) -> None:
         """Handle drag action for PV names.
 
@@ -1,5 +1,5 @@
 from random import random
-from typing import Any
+from typing import Any, ClassVar
 
 from qtpy.QtGui import QColor, QMouseEvent
 from qtpy.QtCore import Qt, Signal
@@ -25,6 +25,9 @@ class ColorButton(QPushButton):
 
     color_changed = Signal(QColor)
 
+    # (palette name, index) -> (palette colors the entry was built from, color)
+    _index_color_cache: ClassVar[dict[tuple[str, int], tuple[list[QColor], QColor]]] = {}
+
     def __init__(self, *args: Any, color: QColor | str = None, index: int = -1, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         if not color:
@@ -110,8 +113,14 @@ class ColorButton(QPushButton):
         """
         if palette not in color_palette:
             palette = "default"
-        modded_index = index % len(color_palette[palette])
-        color = color_palette[palette][modded_index]
+        colors = color_palette[palette]
+
+        cached = ColorButton._index_color_cache.get((palette, index))
+        if cached is None or cached[0] is not colors:
+            modded_index = index % len(colors)
+            dark_factor = (index // len(colors)) * 35
+            cached = (colors, colors[modded_index].darker(100 + dark_factor))
+            ColorButton._index_color_cache[(palette, index)] = cached
 
-        dark_factor = (index // len(color_palette[palette])) * 35
-        return color.darker(100 + dark_factor)
+        # Return a copy so callers can't alter the cached color
+        return QColor(cached[1])
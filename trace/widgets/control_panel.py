@@ -1,4 +1,4 @@
-import re
+from typing import ClassVar
 
 from qtpy import QtGui, QtCore, QtWidgets
 from qtpy.QtCore import Qt, Slot, QTimer
@@ -20,7 +20,7 @@ from widgets import (
     ArchiveSearchWidget,
 )
 from services import Theme, IconColors, ThemeManager
-from utilities import validate_formula, sanitize_for_validation
+from utilities import VAR_PLACEHOLDER_RE, validate_formula, sanitize_for_validation
 
 PV_KEY_PREFIX = "x"
 FORMULA_KEY_PREFIX = "fx"
@@ -46,10 +46,14 @@ class ControlPanel(QtWidgets.QWidget):
         """
         super().__init__()
         self.theme_manager = theme_manager
+        self._plot = None
+        self._plot_from_parent = False
         self.setLayout(QtWidgets.QVBoxLayout())
         # self.setStyleSheet("background-color: white;")
 
         self._curve_dict = {}
+        self._curve_key_by_id = {}
+        self._axes_by_name = {}
         self.key_gen = self._generate_curve_key()
         next(self.key_gen)  # Prime the generator
 
@@ -109,7 +113,18 @@ class ControlPanel(QtWidgets.QWidget):
 
         self.formula_dialog = FormulaDialog(self)
         self.formula_dialog.formula_accepted.connect(self.handle_formula_accepted)
-        self.curve_list_changed.connect(self.formula_dialog.curve_model.refresh)
+        # Coalesce curve list changes from the axes into one curve_list_changed per event loop pass
+        self._list_changed_timer = QTimer(self)
+        self._list_changed_timer.setSingleShot(True)
+        self._list_changed_timer.setInterval(0)
+        self._list_changed_timer.timeout.connect(self.curve_list_changed.emit)
+
+        # Coalesce bursts of curve_list_changed into one model refresh per event loop pass
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self.formula_dialog.curve_model.refresh)
+        self.curve_list_changed.connect(self._refresh_timer.start)
 
         self.update_icons()
         QTimer.singleShot(0, self.pv_line_edit.setFocus)
@@ -149,11 +164,12 @@ class ControlPanel(QtWidgets.QWidget):
     @property
     def plot(self) -> PyDMArchiverTimePlot:
         """Get the associated plot widget."""
-        if not self._plot:
+        if self._plot is None:
             parent = self.parent()
             while not hasattr(parent, "plot"):
                 parent = parent.parent()
             self._plot = parent.plot
+            self._plot_from_parent = True
         return self._plot
 
     @plot.setter
@@ -166,6 +182,19 @@ class ControlPanel(QtWidgets.QWidget):
             The plot widget to associate with this control panel
         """
         self._plot = plot
+        self._plot_from_parent = False
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        """Forget a plot found through the parent chain when reparented.
+
+        Parameters
+        ----------
+        event : QtCore.QEvent
+            The change event
+        """
+        if event.type() == QtCore.QEvent.ParentChange and self._plot_from_parent:
+            self._plot = None
+        super().changeEvent(event)
 
     def search_pv(self) -> None:
         """Show or activate the PV search widget."""
@@ -208,16 +237,64 @@ class ControlPanel(QtWidgets.QWidget):
                 seen_curves[curve_id] = key
 
         for key in to_remove:
-            del self._curve_dict[key]
+            self.unregister_curve(key)
+        for curve_id, key in seen_curves.items():
+            self._curve_key_by_id[curve_id] = key
 
         if to_remove:
-            self.curve_list_changed.emit()
+            self.schedule_curve_list_changed()
+
+    def schedule_curve_list_changed(self) -> None:
+        """Emit curve_list_changed on the next event loop pass. Repeated calls
+        before then collapse into a single emission."""
+        if not self._list_changed_timer.isActive():
+            self._list_changed_timer.start()
 
     @property
     def curve_dict(self) -> dict:
         """Return dictionary of curves with PV keys."""
         return self._curve_dict
 
+    def register_curve(self, key: str, curve: ArchivePlotCurveItem | FormulaCurveItem) -> None:
+        """Store a curve in the curve dictionary under its variable key.
+
+        Parameters
+        ----------
+        key : str
+            The curve's variable key (e.g. x1 or fx1)
+        curve : ArchivePlotCurveItem | FormulaCurveItem
+            The curve to store
+        """
+        self._curve_dict[key] = curve
+        self._curve_key_by_id[id(curve)] = key
+
+    def unregister_curve(self, key: str) -> None:
+        """Remove the curve stored under the given variable key, if any.
+
+        Parameters
+        ----------
+        key : str
+            The curve's variable key
+        """
+        curve = self._curve_dict.pop(key, None)
+        if curve is not None and self._curve_key_by_id.get(id(curve)) == key:
+            del self._curve_key_by_id[id(curve)]
+
+    def curve_key(self, curve: ArchivePlotCurveItem | FormulaCurveItem) -> str | None:
+        """Get the variable key a curve is stored under.
+
+        Parameters
+        ----------
+        curve : ArchivePlotCurveItem | FormulaCurveItem
+            The curve to look up
+
+        Returns
+        -------
+        str | None
+            The curve's variable key, or None if it is not in the curve dictionary
+        """
+        return self._curve_key_by_id.get(id(curve))
+
     def _generate_curve_key(self):
         """Generate a unique variable name for a curve, either pv or formula.
 
@@ -241,15 +318,29 @@ class ControlPanel(QtWidgets.QWidget):
                 key = None
 
     def add_curves(self, pvs: list[str]) -> None:
-        """Add multiple curves from a list of PV names.
+        """Add multiple curves from a list of PV names. Repaints of the plot
+        and control panel, and curve_list_changed emissions, are held until
+        all curves have been added, so each is only updated once for the
+        whole batch.
 
         Parameters
         ----------
         pvs : list[str]
             List of PV names to add as curves
         """
-        for pv in pvs:
-            self.add_curve(pv)
+        self.setUpdatesEnabled(False)
+        self.plot.setUpdatesEnabled(False)
+        blocker = QtCore.QSignalBlocker(self)
+        try:
+            for pv in pvs:
+                self.add_curve(pv)
+        finally:
+            blocker.unblock()
+            self.plot.setUpdatesEnabled(True)
+            self.setUpdatesEnabled(True)
+        # Emit now, superseding any emission scheduled by the axes while adding
+        self._list_changed_timer.stop()
+        self.curve_list_changed.emit()
 
     def add_empty_axis(self, name: str = "") -> "AxisItem":
         logger.debug("Adding new empty axis to the plot")
@@ -268,8 +359,9 @@ class ControlPanel(QtWidgets.QWidget):
         """Add an existing AxisItem to the plot."""
         self.match_axis_tick_font(axis)
         axis_item = AxisItem(axis, control_panel=self, theme_manager=self.theme_manager)
-        axis_item.curves_list_changed.connect(self.curve_list_changed.emit)
+        axis_item.curves_list_changed.connect(self.schedule_curve_list_changed)
         self.axis_list.insertWidget(self.axis_list.count() - 1, axis_item)
+        self._axes_by_name[axis.name] = axis_item
         logger.debug(f"Added axis {axis.name} to plot")
         self.updateGeometry()
 
@@ -289,11 +381,32 @@ class ControlPanel(QtWidgets.QWidget):
 
     def get_axis_item(self, axis_name: str) -> "AxisItem":
         """Get an AxisItem by its name."""
-        for index in range(self.axis_list.count()):
-            item = self.axis_list.itemAt(index).widget()
-            if isinstance(item, AxisItem) and item.name == axis_name:
-                return item
-        return None
+        return self._axes_by_name.get(axis_name)
+
+    def rename_axis_item(self, old_name: str, axis_item: "AxisItem") -> None:
+        """Re-key an AxisItem in the name lookup after its axis was renamed.
+
+        Parameters
+        ----------
+        old_name : str
+            The name the AxisItem was previously registered under
+        axis_item : AxisItem
+            The renamed AxisItem
+        """
+        if self._axes_by_name.get(old_name) is axis_item:
+            del self._axes_by_name[old_name]
+        self._axes_by_name[axis_item.name] = axis_item
+
+    def remove_axis_item(self, axis_item: "AxisItem") -> None:
+        """Drop an AxisItem from the name lookup when it is closed.
+
+        Parameters
+        ----------
+        axis_item : AxisItem
+            The AxisItem being removed
+        """
+        if self._axes_by_name.get(axis_item.name) is axis_item:
+            del self._axes_by_name[axis_item.name]
 
     def get_last_axis_item(self) -> "AxisItem":
         """Get the last AxisItem in the list."""
@@ -450,8 +563,16 @@ class ControlPanel(QtWidgets.QWidget):
         axis_item.add_curve_item(curve_item)
 
     def closeEvent(self, a0: QtGui.QCloseEvent):
-        for axis_item in range(self.axis_list.count()):
-            axis_item.close()
+        self.setUpdatesEnabled(False)
+        try:
+            # Tear down from the end so remaining indices stay valid; -1 skips the stretch.
+            # AxisItem.close would ask to confirm each axis, so it isn't used here.
+            for i in reversed(range(self.axis_list.count() - 1)):
+                axis_item = self.axis_list.itemAt(i).widget()
+                if axis_item is not None:
+                    axis_item.teardown()
+        finally:
+            self.setUpdatesEnabled(True)
         super().closeEvent(a0)
 
 
@@ -545,6 +666,10 @@ class AxisItem(QtWidgets.QWidget):
         self.placeholder = QtWidgets.QWidget(self)
         self.placeholder.hide()
         self.placeholder.setStyleSheet("background-color: lightgrey;")
+        self._placeholder_index = -1
+
+        # CurveItems on this axis, kept in layout order
+        self._curve_widgets = []
 
         self.update_icons()
 
@@ -577,7 +702,7 @@ class AxisItem(QtWidgets.QWidget):
 
     @property
     def plot(self):
-        return self.parent().parent().parent().parent().plot
+        return self.control_panel.plot
 
     @property
     def name(self) -> str:
@@ -598,11 +723,17 @@ class AxisItem(QtWidgets.QWidget):
         CurveItem
             The created CurveItem widget.
         """
+        # The PlotDataItem delegates painting to its child PlotCurveItem; cache that
+        # item's rasterised path so pans don't redraw it from scratch
+        curve_graphics = getattr(plot_curve_item, "curve", None)
+        if hasattr(curve_graphics, "setCacheMode"):
+            curve_graphics.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+
         curve_item = CurveItem(self, plot_curve_item)
-        curve_item.curve_deleted.connect(lambda curve: self.handle_curve_deleted(curve))
-        curve_item.active_toggle.setCheckState(self.active_toggle.checkState())
+        self._connect_curve_item(curve_item)
 
         self.layout().addWidget(curve_item)
+        self._curve_widgets.append(curve_item)
         self.curves_list_changed.emit()
 
         if not self._expanded:
@@ -610,6 +741,18 @@ class AxisItem(QtWidgets.QWidget):
 
         return curve_item
 
+    def _connect_curve_item(self, curve_item: "CurveItem") -> None:
+        """Wire a CurveItem to this AxisItem: listen for its deletion and
+        match its active state to the axis.
+
+        Parameters
+        ----------
+        curve_item : CurveItem
+            The CurveItem being attached to this axis.
+        """
+        curve_item.curve_deleted.connect(self.handle_curve_deleted)
+        curve_item.active_toggle.setCheckState(self.active_toggle.checkState())
+
     def add_curve(self, pv: str, channel_args: dict = None) -> "CurveItem":
         """Create a new ArchivePlotCurveItem for the given PV and add it
         to this AxisItem. Also creates a CurveItem widget for it.
@@ -658,7 +801,7 @@ class AxisItem(QtWidgets.QWidget):
         CurveItem
             The created CurveItem widget.
         """
-        var_names = re.findall(r"{(.+?)}", formula)
+        var_names = VAR_PLACEHOLDER_RE.findall(formula)
         var_dict = {}
 
         for var_name in var_names:
@@ -698,11 +841,12 @@ class AxisItem(QtWidgets.QWidget):
 
     def toggle_expand(self):
         if self._expanded:
-            for index in range(1, self.layout().count()):
-                self.layout().itemAt(index).widget().hide()
+            for curve_item in self._curve_widgets:
+                curve_item.hide()
+            self.placeholder.hide()
         else:
-            for index in range(1, self.layout().count()):
-                self.layout().itemAt(index).widget().show()
+            for curve_item in self._curve_widgets:
+                curve_item.show()
         self._expanded = not self._expanded
 
     @Slot(int)
@@ -710,10 +854,13 @@ class AxisItem(QtWidgets.QWidget):
     def set_active(self, state: int | Qt.CheckState):
         checked = Qt.CheckState(state) == Qt.Checked
         self.source.setVisible(checked)
-        for i in range(1, self.layout().count()):
-            widget = self.layout().itemAt(i).widget()
-            if isinstance(widget, CurveItem):
-                widget.active_toggle.setCheckState(state)
+        for curve_item in self._curve_widgets:
+            if curve_item.active_toggle.checkState() == state:
+                continue
+            # Update the toggle quietly and apply the state directly, skipping the signal hop
+            with QtCore.QSignalBlocker(curve_item.active_toggle):
+                curve_item.active_toggle.setCheckState(state)
+            curve_item.set_active(state)
 
     @Slot(int)
     @Slot(Qt.CheckState)
@@ -725,17 +872,18 @@ class AxisItem(QtWidgets.QWidget):
         self.auto_range_checkbox.setCheckState(QtCore.Qt.Unchecked)
 
     def handle_range_change(self, _, range):
-        self.min_range_line_edit.setText(f"{range[0]:.3g}")
-        self.max_range_line_edit.setText(f"{range[1]:.3g}")
+        # Leave a line edit alone while the user is typing in it, and skip unchanged text
+        new_min = f"{range[0]:.3g}"
+        new_max = f"{range[1]:.3g}"
+        if not self.min_range_line_edit.hasFocus() and self.min_range_line_edit.text() != new_min:
+            self.min_range_line_edit.setText(new_min)
+        if not self.max_range_line_edit.hasFocus() and self.max_range_line_edit.text() != new_max:
+            self.max_range_line_edit.setText(new_max)
 
     def handle_curve_deleted(self, curve):
+        self._curve_widgets = [w for w in self._curve_widgets if w.source is not curve]
         self.curves_list_changed.emit()
-        curve_key_to_delete = None
-
-        for key, value in self.control_panel.curve_dict.items():
-            if value == curve:
-                curve_key_to_delete = key
-                break
+        curve_key_to_delete = self.control_panel.curve_key(curve)
 
         if curve_key_to_delete:
             dependent_formulas = []
@@ -758,8 +906,6 @@ class AxisItem(QtWidgets.QWidget):
             if dependent_formulas:
                 logger.debug(f"Hidden {len(dependent_formulas)} formulas that depended on {curve_key_to_delete}")
 
-            del self.control_panel.curve_dict[curve_key_to_delete]
-
     def find_curve_item_for_curve(self, target_curve):
         """Find the CurveItem widget that corresponds to a given curve"""
         for i in range(self.layout().count()):
@@ -799,8 +945,10 @@ class AxisItem(QtWidgets.QWidget):
     def set_axis_name(self, name: str = None):
         if name is None and self.sender():
             name = self.sender().text()
+        old_name = self.source.name
         self.source.name = name
         self.source.label_text = name
+        self.control_panel.rename_axis_item(old_name, self)
 
     @QtCore.Slot()
     def show_settings_modal(self):
@@ -830,20 +978,32 @@ class AxisItem(QtWidgets.QWidget):
 
     def dragMoveEvent(self, event: QtGui.QDragMoveEvent):
         item = self.childAt(event.position().toPoint())
-        if item != self.placeholder:
-            index = self.layout().indexOf(item) + 1  # drop below target row
-            index = max(1, index)  # don't drop above axis detail row
+        if item == self.placeholder:
+            return
+        index = self.layout().indexOf(item) + 1  # drop below target row
+        index = max(1, index)  # don't drop above axis detail row
+        if index == self._placeholder_index:
+            return
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.layout().removeWidget(self.placeholder)
             self.layout().insertWidget(index, self.placeholder)
+            self._placeholder_index = index
+        finally:
+            self.setUpdatesEnabled(True)
 
     def dragLeaveEvent(self, event: QtGui.QDragLeaveEvent):
         event.accept()
         self.placeholder.hide()
+        self._placeholder_index = -1
 
     def dropEvent(self, event: QtGui.QDropEvent):
         event.accept()
         curve_item = event.source()
         self.control_panel.move_curve_to_axis(curve_item, self.source.name)
         self.placeholder.hide()
+        self._placeholder_index = -1
         if not self._expanded:
             self.toggle_expand()
         self.curves_list_changed.emit()
@@ -865,6 +1025,8 @@ class AxisItem(QtWidgets.QWidget):
         """
         curve_item.curve_deleted.disconnect()
         self.layout().removeWidget(curve_item)
+        if curve_item in self._curve_widgets:
+            self._curve_widgets.remove(curve_item)
         self.plot.plotItem.unlinkDataFromAxis(curve_item.source)
 
         if delete_curve:
@@ -883,14 +1045,16 @@ class AxisItem(QtWidgets.QWidget):
         self.plot.plotItem.linkDataToAxis(curve_item.source, self.name)
         curve_item.source.y_axis_name = self.name
 
-        curve_item.curve_deleted.connect(lambda curve: self.handle_curve_deleted(curve))
-        curve_item.active_toggle.setCheckState(self.active_toggle.checkState())
+        self._connect_curve_item(curve_item)
 
         if self.layout().indexOf(curve_item) != -1:
             self.layout().removeWidget(curve_item)
 
         idx = self.layout().indexOf(self.placeholder)
         self.layout().insertWidget(idx, curve_item)
+        if curve_item not in self._curve_widgets:
+            self._curve_widgets.append(curve_item)
+        self._curve_widgets.sort(key=self.layout().indexOf)
 
         if not self._expanded:
             self.toggle_expand()
@@ -915,24 +1079,41 @@ class AxisItem(QtWidgets.QWidget):
         result = dialog.exec_()
 
         if result == QtWidgets.QMessageBox.Cancel:
-            return
+            return False
 
+        self.teardown()
+        return super().close()
+
+    def teardown(self) -> None:
+        """Remove this axis, its curves, and this widget without asking the user."""
         self.clear_curves()
+        self.control_panel.remove_axis_item(self)
         self.source.sigYRangeChanged.disconnect(self.handle_range_change)
         self.source.linkedView().sigRangeChangedManually.disconnect(self.disable_auto_range)
-        index = self.plot._axes.index(self.source)
-        self.plot.removeAxisAtIndex(index)
+        self._remove_plot_axis()
         self.setParent(None)
         self.deleteLater()
-        return super().close()
+
+    def _remove_plot_axis(self) -> None:
+        """Remove this item's axis from the plot. This does what pydm's
+        removeAxisAtIndex does without first scanning for the axis's index.
+        """
+        self.plot.plotItem.removeAxis(self.source.name)
+        # pydm also tracks its axes in the private _axes list. Axes are torn down
+        # newest first when the panel closes, so pop the last one without a scan
+        plot_axes = self.plot._axes
+        if plot_axes and plot_axes[-1] is self.source:
+            plot_axes.pop()
+        else:
+            plot_axes.remove(self.source)
 
     @property
     def control_panel(self):
         if self.control_panel_ref is None:
-            parent = self.parent().parent().parent().parent()
+            parent = self.parent()
             while parent and not isinstance(parent, ControlPanel):
                 parent = parent.parent()
-            self.control_panel_ref = parent.control_panel
+            self.control_panel_ref = parent
         return self.control_panel_ref
 
 
@@ -952,6 +1133,9 @@ class CurveItem(QtWidgets.QWidget):
     curve_deleted = QtCore.Signal(object)
     unit_changed = QtCore.Signal(str)
 
+    # Rendered connection status pixmaps shared by all CurveItems, keyed by icon cacheKey
+    _status_pixmaps: ClassVar[dict[int, QtGui.QPixmap]] = {}
+
     def __init__(self, axis_item: AxisItem, source: ArchivePlotCurveItem | FormulaCurveItem):
         """Initialize the curve item widget.
 
@@ -964,14 +1148,15 @@ class CurveItem(QtWidgets.QWidget):
         """
         super().__init__()
         self._axis_item = axis_item
+        self._drag_pixmap = None
         self.source = source
         self.control_panel = axis_item.control_panel
 
         self.theme_manager = axis_item.theme_manager
-        self.theme_manager.theme_changed.connect(lambda _: self.update_icons())
+        self.theme_manager.theme_changed.connect(self.on_theme_changed)
 
         self.variable_name = self.control_panel.key_gen.send(self.source)
-        self.control_panel.curve_dict[self.variable_name] = self.source
+        self.control_panel.register_curve(self.variable_name, self.source)
 
         self.setup_layout()
 
@@ -982,7 +1167,18 @@ class CurveItem(QtWidgets.QWidget):
             if unit:
                 self.control_panel.move_curve_to_axis(self, unit)
             else:
-                self.source.unitSignal.connect(lambda unit: self.control_panel.move_curve_to_axis(self, unit))
+                self.source.unitSignal.connect(self.move_to_axis_for_unit)
+
+    @Slot(str)
+    def move_to_axis_for_unit(self, unit: str) -> None:
+        """Move this curve to the axis named after the given unit.
+
+        Parameters
+        ----------
+        unit : str
+            The unit reported by the curve's channel
+        """
+        self.control_panel.move_curve_to_axis(self, unit)
 
     @property
     def plot(self):
@@ -992,10 +1188,24 @@ class CurveItem(QtWidgets.QWidget):
     @property
     def axis_item(self):
         """Get the AxisItem that this CurveItem belongs to."""
-        parent = self.parent()
-        while not isinstance(parent, AxisItem):
-            parent = parent.parent()
-        return parent
+        if self._axis_item is None:
+            parent = self.parent()
+            while not isinstance(parent, AxisItem):
+                parent = parent.parent()
+            self._axis_item = parent
+        return self._axis_item
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        """Forget the cached AxisItem when this CurveItem is moved to a new parent.
+
+        Parameters
+        ----------
+        event : QtCore.QEvent
+            The change event
+        """
+        if event.type() == QtCore.QEvent.ParentChange:
+            self._axis_item = None
+        super().changeEvent(event)
 
     def setup_layout(self):
         """Setup the layout and widgets for the CurveItem."""
@@ -1039,11 +1249,13 @@ class CurveItem(QtWidgets.QWidget):
 
         self.live_connection_status = QtWidgets.QLabel()
         self.live_connection_status.setToolTip("Not connected to live data")
+        self._live_connected = False
         self.source.live_channel_connection.connect(self.update_live_icon)
         pv_settings_layout.addWidget(self.live_connection_status)
 
         self.archive_connection_status = QtWidgets.QLabel()
         self.archive_connection_status.setToolTip("Not connected to archive data")
+        self._archive_connected = False
         self.source.archive_channel_connection.connect(self.update_archive_icon)
         pv_settings_layout.addWidget(self.archive_connection_status)
 
@@ -1068,6 +1280,7 @@ class CurveItem(QtWidgets.QWidget):
         self.label.setText(text)
         self.label.setPlaceholderText(placeholder)
         self.label.returnPressed.connect(self.label.clearFocus)
+        self.label.textChanged.connect(self.invalidate_drag_pixmap)
 
     @Slot()
     def update_icons(self):
@@ -1082,13 +1295,23 @@ class CurveItem(QtWidgets.QWidget):
         self.delete_button.setIcon(delete_icon)
 
         icon_disconnected = self.theme_manager.create_icon("msc.debug-disconnect")
-        self.live_connection_status.setPixmap(icon_disconnected.pixmap(16, 16))
-        self.archive_connection_status.setPixmap(icon_disconnected.pixmap(16, 16))
+        pixmap_disconnected = CurveItem._status_pixmaps.get(icon_disconnected.cacheKey())
+        if pixmap_disconnected is None:
+            pixmap_disconnected = icon_disconnected.pixmap(16, 16)
+            CurveItem._status_pixmaps[icon_disconnected.cacheKey()] = pixmap_disconnected
+        self.live_connection_status.setPixmap(pixmap_disconnected)
+        self.archive_connection_status.setPixmap(pixmap_disconnected)
+        self.invalidate_drag_pixmap()
+
+    def on_theme_changed(self, theme: Theme):
+        """Handle theme changes by updating icons"""
+        self.update_icons()
 
     def show_invalid_icon(self, show=True):
         """Show or hide the invalid formula icon overlaid on the line edit"""
         if not self.is_formula_curve():
             return
+        self.invalidate_drag_pixmap()
 
         if show:
             if self.invalid_action is None:
@@ -1121,6 +1344,7 @@ class CurveItem(QtWidgets.QWidget):
         checked = Qt.CheckState(state) == Qt.Checked
         self.source.setVisible(checked)
         self._update_legend(checked)
+        self.invalidate_drag_pixmap()
 
     def _update_legend(self, visible: bool) -> None:
         """Update the legend entry for this curve to match its visibility.
@@ -1138,11 +1362,21 @@ class CurveItem(QtWidgets.QWidget):
                     return
             legend.addItem(self.source, self.source.name())
 
+    @Slot(bool)
     def update_live_icon(self, connected: bool) -> None:
+        if connected == self._live_connected:
+            return
+        self._live_connected = connected
         self.live_connection_status.setVisible(not connected)
+        self.invalidate_drag_pixmap()
 
+    @Slot(bool)
     def update_archive_icon(self, connected: bool) -> None:
+        if connected == self._archive_connected:
+            return
+        self._archive_connected = connected
         self.archive_connection_status.setVisible(not connected)
+        self.invalidate_drag_pixmap()
 
     @QtCore.Slot()
     def show_settings_modal(self):
@@ -1161,13 +1395,25 @@ class CurveItem(QtWidgets.QWidget):
         if hasattr(self, "active_toggle"):
             curve_color = getattr(self.source, "color_string", None)
             self.active_toggle.setColor(curve_color)
+        self.invalidate_drag_pixmap()
+
+    @Slot()
+    def invalidate_drag_pixmap(self) -> None:
+        """Drop the cached drag pixmap so the next drag grabs the current look."""
+        self._drag_pixmap = None
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self.invalidate_drag_pixmap()
+        super().resizeEvent(event)
 
     def mousePressEvent(self, event: QtGui.QMouseEvent):
         if event.button() == QtCore.Qt.LeftButton and self.handle.geometry().contains(event.position().toPoint()):
             self.hide()  # hide actual widget so it doesn't conflict with pixmap on cursor
             drag = QtGui.QDrag(self)
             drag.setMimeData(QtCore.QMimeData())
-            drag.setPixmap(self.grab())
+            if self._drag_pixmap is None:
+                self._drag_pixmap = self.grab()
+            drag.setPixmap(self._drag_pixmap)
             drag.setHotSpot(self.handle.geometry().center())
             drag.exec()
             self.show()  # show curve after drag, even if it ended outside of an axis
@@ -1182,6 +1428,7 @@ class CurveItem(QtWidgets.QWidget):
         """
         return isinstance(self.source, FormulaCurveItem)
 
+    @Slot()
     def update_formula(self) -> None:
         """Handle formula updates when user edits the formula text."""
         if hasattr(self, "_updating_formula") and self._updating_formula:
@@ -1206,7 +1453,7 @@ class CurveItem(QtWidgets.QWidget):
         self._updating_formula = True
 
         try:
-            var_names = re.findall(r"{(.+?)}", new_formula)
+            var_names = VAR_PLACEHOLDER_RE.findall(new_formula)
 
             for var_name in var_names:
                 if var_name not in self.control_panel._curve_dict:
@@ -1214,12 +1461,8 @@ class CurveItem(QtWidgets.QWidget):
                         f"Variable '{var_name}' not found. Available: {list(self.control_panel._curve_dict.keys())}"
                     )
 
-            expr_body = new_formula[4:]
-            if var_names:
-                python_expr, allowed = sanitize_for_validation(expr_body)
-                validate_formula(python_expr, allowed_symbols=allowed)
-            else:
-                validate_formula(expr_body, allowed_symbols=set())
+            python_expr, allowed = sanitize_for_validation(new_formula[4:])
+            validate_formula(python_expr, allowed_symbols=allowed)
 
             def delayed_update():
                 try:
@@ -1235,7 +1478,7 @@ class CurveItem(QtWidgets.QWidget):
                     if hasattr(self, "_updating_formula"):
                         self._updating_formula = False
 
-            QTimer.singleShot(10, delayed_update)
+            QTimer.singleShot(0, delayed_update)
 
         except Exception as e:
             self._updating_formula = False
@@ -1260,7 +1503,7 @@ class CurveItem(QtWidgets.QWidget):
             The new formula string starting with 'f://' (e.g., 'f://{x1}+{x2}').
         """
 
-        var_names = re.findall(r"{(.+?)}", new_formula)
+        var_names = VAR_PLACEHOLDER_RE.findall(new_formula)
         var_dict = {}
         for var_name in var_names:
             if var_name not in self.control_panel._curve_dict:
@@ -1269,29 +1512,34 @@ class CurveItem(QtWidgets.QWidget):
                 )
             var_dict[var_name] = self.control_panel._curve_dict[var_name]
 
-        new_formula_curve = self.plot.addFormulaChannel(
-            formula=new_formula,
-            name=new_formula,
-            pvs=var_dict,
-            color=self.source.color,
-            useArchiveData=self.source.use_archive_data,
-            yAxisName=self.axis_item.source.name,
-        )
+        # Swap the curves with plot repaints held so the replacement is drawn once
+        self.plot.setUpdatesEnabled(False)
+        try:
+            new_formula_curve = self.plot.addFormulaChannel(
+                formula=new_formula,
+                name=new_formula,
+                pvs=var_dict,
+                color=self.source.color,
+                useArchiveData=self.source.use_archive_data,
+                yAxisName=self.axis_item.source.name,
+            )
 
-        if hasattr(self.source, "formula_invalid_signal"):
-            self.source.formula_invalid_signal.disconnect()
+            if hasattr(self.source, "formula_invalid_signal"):
+                self.source.formula_invalid_signal.disconnect()
 
-        self.plot.removeCurve(self.source)
-        self.source.deleteLater()
-        del self.control_panel._curve_dict[self.variable_name]
-        self.plot.set_needs_redraw()
+            self.plot.removeCurve(self.source)
+            self.source.deleteLater()
+            self.control_panel.unregister_curve(self.variable_name)
+            self.plot.set_needs_redraw()
+        finally:
+            self.plot.setUpdatesEnabled(True)
 
         self.source = new_formula_curve
         self.label.setText(new_formula)
 
         if not self.variable_name.startswith(FORMULA_KEY_PREFIX):
             self.variable_name = self.control_panel.key_gen.send(new_formula_curve)
-        self.control_panel._curve_dict[self.variable_name] = new_formula_curve
+        self.control_panel.register_curve(self.variable_name, new_formula_curve)
 
         self.axis_item.curves_list_changed.emit()
         self.control_panel.cleanup_duplicate_curves()
@@ -1320,9 +1568,10 @@ class CurveItem(QtWidgets.QWidget):
         except Exception as e:
             logger.warning(f"Error removing curve from plot: {e}")
 
-        del self.control_panel._curve_dict[self.variable_name]
-
+        # Emit while the curve is still registered so its key can be resolved
+        # when hiding formulas that depend on it
         self.curve_deleted.emit(curve)
+        self.control_panel.unregister_curve(self.variable_name)
         self.deleteLater()
 
         return super().close()
@@ -1,4 +1,6 @@
-from qtpy.QtCore import Qt, Signal
+from itertools import zip_longest
+
+from qtpy.QtCore import Qt, Slot, Signal
 from qtpy.QtWidgets import (
     QLabel,
     QWidget,
@@ -49,6 +51,21 @@ class CurveColorPaletteModal(QWidget):
         self.color_preview_layout.setAlignment(Qt.AlignLeft)
         main_layout.addWidget(color_preview)
 
+        # preview stylesheets for every palette, built once
+        self._preview_styles = {
+            name: [f"background-color: {color.name()}; border-radius: 4px;" for color in colors]
+            for name, colors in color_palette.items()
+        }
+
+        # one preview button per color in the largest palette, restyled on palette change
+        self._preview_buttons = []
+        for _ in range(max(len(styles) for styles in self._preview_styles.values())):
+            button = QPushButton()
+            button.setFixedWidth(30)
+            button.setVisible(False)
+            self.color_preview_layout.addWidget(button)
+            self._preview_buttons.append(button)
+
         # button to apply palette to existing curves
         apply_button = QPushButton("Apply to current")
         apply_button.clicked.connect(self.apply_palette)
@@ -58,32 +75,24 @@ class CurveColorPaletteModal(QWidget):
 
         self.set_palette()
 
+    @Slot()
     def set_palette(self):
         """Set default palette to option currently selected in combobox"""
         palette = self.palette_cbox.currentText()
-        self.clear_layout(self.color_preview_layout)
         # Display preview of colors
-        for color in color_palette[palette]:
-            button = QPushButton()
-            button.setStyleSheet(f"background-color: {color.name()}; border-radius: 4px;")
-            button.setFixedWidth(30)
-            self.color_preview_layout.addWidget(button)
+        for button, style in zip_longest(self._preview_buttons, self._preview_styles[palette]):
+            button.setVisible(style is not None)
+            if style is not None:
+                button.setStyleSheet(style)
         # Emit signal with selected palette
         self.sig_palette_changed.emit(palette, False)
 
+    @Slot()
     def apply_palette(self):
         """Apply palette to existing curves"""
         palette = self.palette_cbox.currentText()
         self.sig_palette_changed.emit(palette, True)
 
-    def clear_layout(self, layout):
-        """Remove widgets from QLayout."""
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()  # Schedule deletion of the widget
-
     @property
     def is_axis(self):
         """Check whether this instance of modal's parent is an axisItem"""
@@ -1,5 +1,5 @@
 from qtpy.QtGui import QColor
-from qtpy.QtCore import Qt, Slot, Signal
+from qtpy.QtCore import Qt, Slot, Signal, QSignalBlocker
 from qtpy.QtWidgets import QWidget, QCheckBox, QLineEdit, QVBoxLayout
 
 from pydm.widgets.archiver_time_plot import TimePlotCurveItem, PyDMArchiverTimePlot
@@ -7,6 +7,10 @@ from pydm.widgets.archiver_time_plot import TimePlotCurveItem, PyDMArchiverTimeP
 from config import logger
 from widgets import ColorButton, SettingsTitle, ComboBoxWrapper, SettingsRowItem
 
+_STEP_MODES = frozenset({"left", "right", "center"})
+_WIDTH_OPTIONS = {f"{i}px": i for i in range(1, 6)}
+_SIZE_OPTIONS = {f"{i}px": i for i in range(5, 26, 5)}
+
 
 class CurveSettingsModal(QWidget):
     """Modal widget for configuring individual curve settings including name, color,
@@ -41,14 +45,14 @@ class CurveSettingsModal(QWidget):
         title_label = SettingsTitle(self, "Curve Settings", size=14)
         main_layout.addWidget(title_label)
 
-        name_edit = QLineEdit(curve.name(), self)
-        name_edit.editingFinished.connect(self.set_curve_name)
-        name_row = SettingsRowItem(self, "Curve Name", name_edit)
+        self.name_edit = QLineEdit(curve.name(), self)
+        self.name_edit.editingFinished.connect(self.set_curve_name)
+        name_row = SettingsRowItem(self, "Curve Name", self.name_edit)
         main_layout.addLayout(name_row)
 
-        color_button = ColorButton(parent=self, color=curve.color_string)
-        color_button.color_changed.connect(self.set_curve_color)
-        color_row = SettingsRowItem(self, "Color", color_button)
+        self.color_button = ColorButton(parent=self, color=curve.color_string)
+        self.color_button.color_changed.connect(self.set_curve_color)
+        color_row = SettingsRowItem(self, "Color", self.color_button)
         main_layout.addLayout(color_row)
 
         self.bin_count_line_edit = None
@@ -78,42 +82,41 @@ class CurveSettingsModal(QWidget):
         line_title_label = SettingsTitle(self, "Line")
         main_layout.addWidget(line_title_label)
 
-        init_curve_type = "Step" if curve.stepMode in ["left", "right", "center"] else "Direct"
-        type_combo = ComboBoxWrapper(self, {"Direct": None, "Step": "right"}, init_curve_type)
-        type_combo.text_changed.connect(self.set_curve_type)
-        type_row = SettingsRowItem(self, "  Type", type_combo)
+        init_curve_type = "Step" if curve.stepMode in _STEP_MODES else "Direct"
+        self.type_combo = ComboBoxWrapper(self, {"Direct": None, "Step": "right"}, init_curve_type)
+        self.type_combo.text_changed.connect(self.set_curve_type)
+        type_row = SettingsRowItem(self, "  Type", self.type_combo)
         main_layout.addLayout(type_row)
 
-        style_combo = ComboBoxWrapper(self, TimePlotCurveItem.lines, curve.lineStyle)
-        style_combo.text_changed.connect(self.set_curve_style)
-        style_row = SettingsRowItem(self, "  Style", style_combo)
+        self.style_combo = ComboBoxWrapper(self, TimePlotCurveItem.lines, curve.lineStyle)
+        self.style_combo.text_changed.connect(self.set_curve_style)
+        style_row = SettingsRowItem(self, "  Style", self.style_combo)
         main_layout.addLayout(style_row)
 
-        width_options = {f"{i}px": i for i in range(1, 6)}
-        width_combo = ComboBoxWrapper(self, width_options, curve.lineWidth)
-        width_combo.text_changed.connect(self.set_curve_width)
-        width_row = SettingsRowItem(self, "  Width", width_combo)
+        self.width_combo = ComboBoxWrapper(self, _WIDTH_OPTIONS, curve.lineWidth)
+        self.width_combo.text_changed.connect(self.set_curve_width)
+        width_row = SettingsRowItem(self, "  Width", self.width_combo)
         main_layout.addLayout(width_row)
 
-        extension_option = QCheckBox(self)
-        extension_option.stateChanged.connect(self.set_extension_option)
-        extension_option_row = SettingsRowItem(self, "  Line Extension", extension_option)
+        self.extension_option = QCheckBox(self)
+        self.extension_option.stateChanged.connect(self.set_extension_option)
+        extension_option_row = SettingsRowItem(self, "  Line Extension", self.extension_option)
         main_layout.addLayout(extension_option_row)
 
         symbol_title_label = SettingsTitle(self, "Symbol")
         main_layout.addWidget(symbol_title_label)
 
-        shape_combo = ComboBoxWrapper(self, TimePlotCurveItem.symbols, curve.symbol)
-        shape_combo.text_changed.connect(self.set_symbol_shape)
-        shape_row = SettingsRowItem(self, "  Shape", shape_combo)
+        self.shape_combo = ComboBoxWrapper(self, TimePlotCurveItem.symbols, curve.symbol)
+        self.shape_combo.text_changed.connect(self.set_symbol_shape)
+        shape_row = SettingsRowItem(self, "  Shape", self.shape_combo)
         main_layout.addLayout(shape_row)
 
-        size_options = {f"{i}px": i for i in range(5, 26, 5)}
-        size_combo = ComboBoxWrapper(self, size_options, curve.symbolSize)
-        size_combo.text_changed.connect(self.set_symbol_size)
-        size_row = SettingsRowItem(self, "  Size", size_combo)
+        self.size_combo = ComboBoxWrapper(self, _SIZE_OPTIONS, curve.symbolSize)
+        self.size_combo.text_changed.connect(self.set_symbol_size)
+        size_row = SettingsRowItem(self, "  Size", self.size_combo)
         main_layout.addLayout(size_row)
 
+    @Slot()
     def set_curve_data_bins(self) -> None:
         """Set the optimized data bins for the curve based on user input.
 
@@ -134,28 +137,61 @@ class CurveSettingsModal(QWidget):
         except (AttributeError, ValueError) as e:
             logger.warning(f"Unable to set data bins: {e}")
 
-    def set_live_data_connection(self, state: Qt.CheckState) -> None:
+    @Slot(int)
+    @Slot(Qt.CheckState)
+    def set_live_data_connection(self, state: int | Qt.CheckState) -> None:
         """Enable or disable live data connection for the curve.
 
         Parameters
         ----------
-        state : Qt.CheckState
+        state : int or Qt.CheckState
             The checkbox state
         """
-        self.curve.liveData = state == Qt.Checked
+        self.curve.liveData = Qt.CheckState(state) == Qt.Checked
 
-    def set_archive_data_connection(self, state: Qt.CheckState) -> None:
+    @Slot(int)
+    @Slot(Qt.CheckState)
+    def set_archive_data_connection(self, state: int | Qt.CheckState) -> None:
         """Enable or disable archive data connection for the curve.
 
         Parameters
         ----------
-        state : Qt.CheckState
+        state : int or Qt.CheckState
             The checkbox state
         """
-        self.curve.use_archive_data = state == Qt.Checked
+        self.curve.use_archive_data = Qt.CheckState(state) == Qt.Checked
+
+    def refresh_from_curve(self) -> None:
+        """Update the inputs to match the curve's current settings, which may
+        have changed elsewhere since the modal was last shown. Signals are
+        blocked so nothing is written back to the curve.
+        """
+        curve = self.curve
+        with QSignalBlocker(self.name_edit):
+            self.name_edit.setText(curve.name())
+        with QSignalBlocker(self.color_button):
+            self.color_button.color = QColor(curve.color)
+        with QSignalBlocker(self.live_toggle):
+            self.live_toggle.setChecked(bool(curve.liveData))
+        with QSignalBlocker(self.archive_toggle):
+            self.archive_toggle.setChecked(bool(curve.use_archive_data))
+        with QSignalBlocker(self.type_combo):
+            self.type_combo.set_value("Step" if curve.stepMode in _STEP_MODES else "Direct")
+        with QSignalBlocker(self.style_combo):
+            self.style_combo.set_value(curve.lineStyle)
+        with QSignalBlocker(self.width_combo):
+            self.width_combo.set_value(curve.lineWidth)
+        with QSignalBlocker(self.extension_option):
+            self.extension_option.setChecked(bool(getattr(curve, "show_extension_line", False)))
+        with QSignalBlocker(self.shape_combo):
+            self.shape_combo.set_value(curve.symbol)
+        with QSignalBlocker(self.size_combo):
+            self.size_combo.set_value(curve.symbolSize)
 
     def show(self) -> None:
         """Show the modal positioned relative to its parent widget."""
+        self.refresh_from_curve()
+
         # Reset Bin Count LineEdit if it exists
         if self.bin_count_line_edit:
             self.bin_count_line_edit.setStyleSheet("")
@@ -175,17 +211,17 @@ class CurveSettingsModal(QWidget):
         """
         sender = self.sender()
         name = sender.text()
+        current_name = self.curve.name()
 
         if not name:
-            sender.blockSignals(True)
-            sender.setText(self.curve.name())
-            sender.blockSignals(False)
-        elif name != self.curve.name():
+            with QSignalBlocker(sender):
+                sender.setText(current_name)
+        elif name != current_name:
             legend_label = self.legend.getLabel(self.curve)
             legend_label.setText(name)
 
-            x, y = self.curve.getData()
-            self.curve.setData(name=name, x=x, y=y)
+            # The name lives in the PlotDataItem's opts; renaming shouldn't re-set the data
+            self.curve.opts["name"] = name
 
     @Slot(QColor)
     def set_curve_color(self, color: QColor) -> None:
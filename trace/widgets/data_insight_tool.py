@@ -1,18 +1,25 @@
 import os
 import re
+import csv
 import json
-import logging
+from bisect import bisect_right
+from typing import Any, ClassVar
 from pathlib import Path
 from datetime import datetime, timezone
+from functools import lru_cache
+from threading import Lock
+from collections import OrderedDict
 
 import epics
 import numpy as np
 import pandas as pd
 from scipy.io import savemat
+from dateutil.tz import tzlocal
 from qtpy.QtCore import (
     Qt,
     QUrl,
     Slot,
+    QTimer,
     Signal,
     QObject,
     QThread,
@@ -27,6 +34,7 @@ from qtpy.QtWidgets import (
     QComboBox,
     QFileDialog,
     QHBoxLayout,
+    QHeaderView,
     QMessageBox,
     QPushButton,
     QVBoxLayout,
@@ -38,27 +46,163 @@ from pydm.widgets.archiver_time_plot import (
     PyDMArchiverTimePlot,
 )
 
+from config import logger
 from widgets import FrozenTableView
 
+# orjson is optional and only used for speed; the stdlib json module is the fallback
+try:
+    import orjson
+
+    def json_loads(data: bytes | bytearray) -> Any:
+        # orjson rejects the NaN and Infinity literals the archiver can send; json accepts them
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        # Match orjson's output: UTF-8 text as is and no NaN/Infinity literals
+        return json.dumps(obj, indent=2, ensure_ascii=False, allow_nan=False).encode()
+
+
 TZ = datetime.now().astimezone().tzinfo
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+# Pulls the extension out of a file dialog filter, e.g. "JSON File (*.json)" -> ".json"
+EXTENSION_FILTER_RE = re.compile(r"\*(.*?)\)")
+ARCHIVE_CACHE_MAX_ROWS = 1_000_000
+GET_DATA_THROTTLE_MS = 200
+FETCH_BATCH_ROWS = 500
+PV_CACHE_MAX_SIZE = 256
 SEVERITY_MAP = {0: "NO_ALARM", 1: "MINOR", 2: "MAJOR", 3: "INVALID"}
 
-logger = logging.getLogger("")
-if not logger.hasHandlers():
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("[%(asctime)s] [%(levelname)-8s] - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-    logger.setLevel("DEBUG")
-    handler.setLevel("DEBUG")
+# Severity and Source are stored as uint8 codes into these name arrays
+LIVE_SEVERITY = len(SEVERITY_MAP)
+SEVERITY_NAMES = np.array([SEVERITY_MAP[i] for i in range(LIVE_SEVERITY)] + ["NaN"], dtype=object)
+ARCHIVE_SOURCE, LIVE_SOURCE = 0, 1
+SOURCE_NAMES = np.array(["Archive", "Live"], dtype=object)
+
+
+def _to_local_datetimes(timestamps: np.ndarray, unit: str = "s") -> pd.DatetimeIndex:
+    """Convert an array of POSIX timestamps to naive local datetimes in one
+    vectorized call, matching datetime.fromtimestamp for each element.
+
+    Parameters
+    ----------
+    timestamps : np.ndarray
+        Time since the epoch
+    unit : str, optional
+        The unit of the timestamps, by default "s". Integer nanoseconds ("ns")
+        are converted exactly.
+
+    Returns
+    -------
+    pd.DatetimeIndex
+        The timestamps as timezone-naive local datetimes
+    """
+    if unit == "s":
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+    utc_dt = pd.to_datetime(timestamps, unit=unit, utc=True)
+    return utc_dt.tz_convert(tzlocal()).tz_localize(None)
+
+
+def build_archive_df(data_dict: list[dict]) -> pd.DataFrame | None:
+    """Build a DataFrame with the model's columns from a decoded Archiver
+    Appliance reply. Severity and Source hold uint8 codes into SEVERITY_NAMES
+    and SOURCE_NAMES.
+
+    Parameters
+    ----------
+    data_dict : list[dict]
+        The decoded JSON reply from the Archiver Appliance
+
+    Returns
+    -------
+    pd.DataFrame | None
+        The archived points, or None if the reply contained no points
+    """
+    points = data_dict[0]["data"]
+    n_points = len(points)
+    if n_points == 0:
+        return None
+
+    secs = np.fromiter((p["secs"] for p in points), dtype=np.int64, count=n_points)
+    nanos = np.fromiter((p["nanos"] for p in points), dtype=np.int64, count=n_points)
+    severity = np.fromiter((p["severity"] for p in points), dtype=np.uint8, count=n_points)
+    # Scalar float PVs fill a float64 array directly; ints, strings and waveforms
+    # are left for pandas to infer from a list
+    if isinstance(points[0]["val"], float):
+        values = np.fromiter((p["val"] for p in points), dtype=np.float64, count=n_points)
+    else:
+        values = [p["val"] for p in points]
+
+    return pd.DataFrame(
+        {
+            "Datetime": _to_local_datetimes(secs * 1_000_000_000 + nanos, unit="ns"),
+            "Value": values,
+            "Severity": severity,
+            "Source": np.full(n_points, ARCHIVE_SOURCE, dtype=np.uint8),
+        }
+    )
+
+
+def range_overlap(
+    range_a: list[float] | tuple[float, float], range_b: list[float] | tuple[float, float]
+) -> tuple[float, float] | None:
+    """Return the intersection of two closed ranges.
+
+    Parameters
+    ----------
+    range_a : list[float] | tuple[float, float]
+        The first (start, end) range
+    range_b : list[float] | tuple[float, float]
+        The second (start, end) range
+
+    Returns
+    -------
+    tuple[float, float] | None
+        The overlapping (start, end) range, or None if the ranges don't overlap
+    """
+    start = max(range_a[0], range_b[0])
+    end = min(range_a[1], range_b[1])
+    return (start, end) if start <= end else None
+
+
+@lru_cache(maxsize=256)
+def archiver_timestamp(timestamp: float) -> str:
+    """Format a POSIX timestamp as the UTC ISO 8601 string, with millisecond
+    precision, that the Archiver Appliance expects (e.g. 2024-01-01T00:00:00.000Z).
+
+    Parameters
+    ----------
+    timestamp : float
+        Seconds since the epoch
+
+    Returns
+    -------
+    str
+        The formatted timestamp
+    """
+    utc_dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return utc_dt.isoformat(timespec="milliseconds").replace("+00:00", "Z")
 
 
 class CAGetThread(QThread):
     """Thread for making a CA get request to the given address. This is used
-    to get the description of the curve.
+    to get the description of the curve. PVs are kept in pv_cache so later
+    requests for the same address reuse the connected channel. Only the
+    PV_CACHE_MAX_SIZE most recently used channels are kept connected.
     """
 
     result_ready = Signal(object)
+    pv_cache: ClassVar[OrderedDict[str, epics.PV]] = OrderedDict()
+    # pv_cache is shared by every CAGetThread and the GUI thread
+    pv_cache_lock: ClassVar[Lock] = Lock()
 
     def __init__(self, parent: QObject = None, address: str = "") -> None:
         super().__init__(parent=parent)
@@ -69,7 +213,21 @@ class CAGetThread(QThread):
         """Get the value for the given address. Interruptable via the
         stop_flag. Does not attempt to emit the PV Value if interrupted.
         """
-        pv = epics.PV(self.address)
+        pv = self.cached_pv(self.address)
+        if pv is None:
+            new_pv = epics.PV(self.address, auto_monitor=True)
+            evicted_pvs = []
+            with self.pv_cache_lock:
+                # Another thread may have cached this address while the PV was created
+                pv = self.pv_cache.setdefault(self.address, new_pv)
+                self.pv_cache.move_to_end(self.address)
+                while len(self.pv_cache) > PV_CACHE_MAX_SIZE:
+                    evicted_pvs.append(self.pv_cache.popitem(last=False)[1])
+            if pv is not new_pv:
+                evicted_pvs.append(new_pv)
+            # Disconnect outside the lock, once the PVs are no longer reachable from the cache
+            for evicted_pv in evicted_pvs:
+                evicted_pv.disconnect()
 
         if self.stop_flag:
             return
@@ -83,6 +241,69 @@ class CAGetThread(QThread):
         """Set the stop flag"""
         self.stop_flag = True
 
+    @classmethod
+    def cached_pv(cls, address: str) -> epics.PV | None:
+        """Return the cached PV for the given address, marking it as recently used.
+
+        Parameters
+        ----------
+        address : str
+            The address of the PV
+
+        Returns
+        -------
+        epics.PV | None
+            The cached PV, or None if the address hasn't been requested
+        """
+        with cls.pv_cache_lock:
+            pv = cls.pv_cache.get(address)
+            if pv is not None:
+                cls.pv_cache.move_to_end(address)
+        return pv
+
+
+class ArchiveParseThread(QThread):
+    """Thread for decoding an Archiver Appliance reply and building its
+    DataFrame, keeping large replies from blocking the GUI thread.
+    """
+
+    result_ready = Signal(object)
+
+    def __init__(
+        self, parent: QObject = None, reply_bytes: bytes | bytearray = b"", cache_key: tuple | None = None
+    ) -> None:
+        super().__init__(parent=parent)
+        self.reply_bytes = reply_bytes
+        self.cache_key = cache_key
+        self.stop_flag = False
+
+    def run(self) -> None:
+        """Parse the reply and emit the resulting DataFrame, or None if the
+        reply held no data. Does not emit if interrupted via the stop_flag.
+        """
+        try:
+            archive_df = build_archive_df(json_loads(self.reply_bytes))
+        except json.JSONDecodeError:
+            logger.warning("Data Insight Tool: No data received from archiver")
+            archive_df = None
+            # Don't cache a failed reply
+            self.cache_key = None
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.warning(f"Data Insight Tool: Malformed reply received from archiver: {e!r}")
+            archive_df = None
+            self.cache_key = None
+        finally:
+            # The reply body can be large; don't hold it once it has been parsed
+            self.reply_bytes = None
+
+        if self.stop_flag:
+            return
+        self.result_ready.emit(archive_df)
+
+    def stop(self) -> None:
+        """Set the stop flag"""
+        self.stop_flag = True
+
 
 class DataVisualizationModel(QAbstractTableModel):
     """Table Model for fetching and storing the data for a given curve on the
@@ -91,49 +312,175 @@ class DataVisualizationModel(QAbstractTableModel):
     """
 
     reply_recieved = Signal()
+    # Bytes received and total bytes (-1 if unknown) of the current archiver reply
+    reply_progress = Signal("qint64", "qint64")
     description_changed = Signal()
     _df_columns = ["Datetime", "Value", "Severity", "Source"]
+    # Name lookups for columns stored as codes, by column index
+    _column_names = (None, None, SEVERITY_NAMES, SOURCE_NAMES)
 
     def __init__(self, parent: QObject = None) -> None:
         super().__init__(parent)
-        self.df = pd.DataFrame(columns=self._df_columns)
+        # Data is held as frames, dicts of one array per column, in display order.
+        # A DataFrame is only assembled when df is read.
+        self._frames = []
+        self._frame_cols = []
+        self._frame_offsets = []
+        self._row_count = 0
+        # Rows exposed to views so far; more are exposed through fetchMore as they scroll
+        self._visible_rows = 0
+        self._df = None
 
         self.address = None
         self.unit = None
         self.description = None
         self.caget_thread = None
+        self.archive_parse_thread = None
         self._decode_as_string = False
 
+        # (pv, from_ts, to_ts) -> archive rows fetched for that range, least recently used first
+        self._archive_cache: OrderedDict[tuple[str, float, float], pd.DataFrame] = OrderedDict()
+
         self.network_manager = QNetworkAccessManager()
         self.network_manager.finished.connect(self.recieve_archive_reply)
+        # The reply for the data currently shown; replies for earlier requests are ignored
+        self.archive_reply = None
+        # Body of archive_reply received so far, drained from the reply as it arrives
+        self._archive_reply_body = bytearray()
 
     def rowCount(self, index: QModelIndex = QModelIndex()) -> int:
         """Return the row count of the table"""
         if index is not None and index.isValid():
             return 0
-        return self.df.shape[0]
+        return self._visible_rows
+
+    def canFetchMore(self, parent: QModelIndex | None = None) -> bool:
+        """Return whether there are rows not yet exposed to views"""
+        if parent is not None and parent.isValid():
+            return False
+        return self._visible_rows < self._row_count
+
+    def fetchMore(self, parent: QModelIndex | None = None) -> None:
+        """Expose the next FETCH_BATCH_ROWS rows to views"""
+        if parent is not None and parent.isValid():
+            return
+        new_visible = min(self._row_count, self._visible_rows + FETCH_BATCH_ROWS)
+        if new_visible <= self._visible_rows:
+            return
+        self.beginInsertRows(QModelIndex(), self._visible_rows, new_visible - 1)
+        self._visible_rows = new_visible
+        self.endInsertRows()
 
     def columnCount(self, index: QModelIndex = QModelIndex()) -> int:
         """Return the column count of the table"""
         if index is not None and index.isValid():
             return 0
-        return self.df.shape[1]
+        return len(self._df_columns)
 
     def data(self, index: QModelIndex, role: Qt.ItemDataRole = Qt.DisplayRole) -> str:
         """Return the data for the associated role. Currently only supporting DisplayRole."""
         if not index.isValid():
             return None
         elif role == Qt.DisplayRole:
-            val = self.df.iat[index.row(), index.column()]
+            row = index.row()
+            frame_ind = bisect_right(self._frame_offsets, row) - 1
+            val = self._frame_cols[frame_ind][index.column()][row - self._frame_offsets[frame_ind]]
+            if isinstance(val, str):
+                return val
             if index.column() == 1 and self.decode_as_string:
-                val = self.list_to_ascii(val)
+                return self.list_to_ascii(val)
             return str(val)
         return None
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: Qt.ItemDataRole = Qt.DisplayRole) -> str:
         """Return data associated with the header"""
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            return self.df.columns[section]
+            return self._df_columns[section]
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """The model's data, one row per archived or live point. The stored
+        frames are only concatenated when this is read.
+        """
+        if self._df is None:
+            if not self._frames:
+                self._df = pd.DataFrame(columns=self._df_columns)
+            else:
+                columns = {}
+                for name, names in zip(self._df_columns, self._column_names):
+                    column = np.concatenate([frame[name] for frame in self._frames])
+                    columns[name] = column if names is None else pd.Categorical.from_codes(column, categories=names)
+                self._df = pd.DataFrame(columns, copy=False)
+        return self._df
+
+    def clear(self) -> None:
+        """Remove all rows from the model"""
+        self.beginResetModel()
+        self._frames = []
+        self._frame_cols = []
+        self._update_frame_offsets()
+        self._visible_rows = 0
+        self.endResetModel()
+
+    @classmethod
+    def _frame_from_df(cls, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Return the dataframe's columns as a frame of NumPy arrays"""
+        return {name: df[name].to_numpy() for name in cls._df_columns}
+
+    @classmethod
+    def _display_columns(cls, frame: dict[str, np.ndarray]) -> list[np.ndarray]:
+        """Return one array per column of the frame for data() to index.
+        Datetimes, numeric values and coded columns are formatted to strings
+        once here rather than on every repaint. Object values (e.g. waveforms)
+        are left as is since they depend on decode_as_string.
+        """
+        display_columns = []
+        for name, names in zip(cls._df_columns, cls._column_names):
+            arr = frame[name]
+            if names is not None:
+                arr = names[arr]
+            elif arr.dtype.kind == "M":
+                arr = pd.DatetimeIndex(arr).strftime(DATETIME_FORMAT).to_numpy()
+            elif arr.dtype.kind in "biuf":
+                arr = arr.astype(str)
+            display_columns.append(arr)
+        return display_columns
+
+    def _update_frame_offsets(self) -> None:
+        """Recompute the first row of each frame and drop the assembled df"""
+        self._frame_offsets = []
+        self._row_count = 0
+        for frame in self._frames:
+            self._frame_offsets.append(self._row_count)
+            self._row_count += len(frame["Datetime"])
+        self._df = None
+
+    def _prepend_frame(self, frame: dict[str, np.ndarray]) -> None:
+        """Insert the given rows at the top of the model without copying the
+        existing data. Large frames reset the model so only the rows already
+        exposed, or one batch, are shown; the rest are fetched as views scroll.
+
+        Parameters
+        ----------
+        frame : dict[str, np.ndarray]
+            One array per model column holding the rows to be shown above the current rows
+        """
+        n_rows = len(frame["Datetime"])
+        reset = self._visible_rows == 0 or n_rows >= FETCH_BATCH_ROWS
+
+        if reset:
+            self.beginResetModel()
+        else:
+            self.beginInsertRows(QModelIndex(), 0, n_rows - 1)
+        self._frames.insert(0, frame)
+        self._frame_cols.insert(0, self._display_columns(frame))
+        self._update_frame_offsets()
+        if reset:
+            self._visible_rows = min(self._row_count, max(self._visible_rows, FETCH_BATCH_ROWS))
+            self.endResetModel()
+        else:
+            self._visible_rows += n_rows
+            self.endInsertRows()
 
     @property
     def decode_as_string(self) -> bool:
@@ -149,6 +496,7 @@ class DataVisualizationModel(QAbstractTableModel):
             end = self.index(self.rowCount(), 1)
             self.dataChanged.emit(start, end)
 
+    @Slot(object)
     def set_description(self, description: str) -> None:
         """Set the description of the curve. This is called when the CAGetThread
         emits a result_ready signal.
@@ -161,7 +509,9 @@ class DataVisualizationModel(QAbstractTableModel):
         self.description = description
         self.description_changed.emit()
 
-    def set_all_data(self, curve_item: TimePlotCurveItem, x_range: list[int] | tuple[int, int]) -> None:
+    def set_all_data(
+        self, curve_item: TimePlotCurveItem, x_range: list[int] | tuple[int, int], use_cache: bool = True
+    ) -> None:
         """Set the model's data for the given curve and the given time range.
         This function determines what kind of data should be saved and prompts
         the methods for setting live or archived data as necessary. This also
@@ -173,38 +523,45 @@ class DataVisualizationModel(QAbstractTableModel):
             The curve for the model to collect and store data on
         x_range : list[int] | tuple[int, int]
             The time range to collect and store data between
+        use_cache : bool, optional
+            Whether archive data may come from a previous reply, by default True
         """
         self.address = curve_item.address if curve_item.address else ""
         self.unit = curve_item.units
 
-        # Set the meta data label of the DataInsightTool
-        self.set_description("Loading...")
-
         # Create a new CAGetThread to get the description of the curve
         if isinstance(self.caget_thread, CAGetThread) and self.caget_thread.isRunning():
             self.caget_thread.stop()
-        self.caget_thread = CAGetThread(self, self.address + ".DESC")
-        self.caget_thread.result_ready.connect(self.set_description)
-        self.caget_thread.start()
+        desc_address = self.address + ".DESC"
+        desc_pv = CAGetThread.cached_pv(desc_address)
+        if desc_pv is not None and desc_pv.connected:
+            # The monitored channel already holds the value; no need for a thread
+            self.set_description(desc_pv.value)
+        else:
+            # Set the meta data label of the DataInsightTool
+            self.set_description("Loading...")
+            self.caget_thread = CAGetThread(self, desc_address)
+            self.caget_thread.result_ready.connect(self.set_description)
+            self.caget_thread.start()
 
         curve_range = (curve_item.min_x(), curve_item.max_x())
-        left_ts = max(x_range[0], curve_range[0])
-        right_ts = min(x_range[1], curve_range[1])
+        live_range = range_overlap(x_range, curve_range)
 
-        # Reset data model to empty state
-        self.beginResetModel()
-        self.df = pd.DataFrame(columns=self._df_columns)
-        self.endResetModel()
+        # Reset data model to empty state, discarding any reply still in flight or being parsed
+        self.abort_archive_reply()
+        self.stop_archive_parse()
+        self.archive_parse_thread = None
+        self.clear()
 
         # Populate the model with live data if it is shown on the plot
-        if (curve_range[0] <= x_range[1]) and (x_range[0] <= curve_range[1]):
-            self.set_live_data(curve_item, (left_ts, right_ts))
+        if live_range is not None:
+            self.set_live_data(curve_item, live_range)
 
-        # Populate the model with archive data if it is shown on the plot
+        # Populate the model with archive data if the plot starts before the live data
         if x_range[0] <= curve_range[0]:
-            self.request_archive_data(curve_item.address, (x_range[0], left_ts))
+            self.request_archive_data(curve_item.address, (x_range[0], curve_range[0]), use_cache=use_cache)
         else:
-            # Emulate network reply being recieved for parent widget
+            # No request is made, so emulate the reply being recieved for the parent widget
             self.reply_recieved.emit()
 
     def set_live_data(self, curve_item: TimePlotCurveItem, x_range: list[int] | tuple[int, int]) -> None:
@@ -223,25 +580,25 @@ class DataVisualizationModel(QAbstractTableModel):
             return
 
         data = curve_item.data_buffer[:, -data_n:]
-        indices = np.where((x_range[0] <= data[0]) & (data[0] <= x_range[1]))[0]
 
-        live_df = pd.DataFrame(
+        # Buffer timestamps are in ascending order, so the range is a contiguous slice
+        start = np.searchsorted(data[0], x_range[0], side="left")
+        end = np.searchsorted(data[0], x_range[1], side="right")
+        n_points = end - start
+        if n_points <= 0:
+            return
+
+        # Copy the values out since the curve keeps writing into its buffer
+        self._prepend_frame(
             {
-                "Datetime": [datetime.fromtimestamp(ts) for ts in data[0, indices]],
-                "Value": data[1, indices],
-                "Severity": ["NaN"] * indices.size,
-                "Source": ["Live"] * indices.size,
+                "Datetime": _to_local_datetimes(data[0, start:end]).to_numpy(),
+                "Value": data[1, start:end].copy(),
+                "Severity": np.full(n_points, LIVE_SEVERITY, dtype=np.uint8),
+                "Source": np.full(n_points, LIVE_SOURCE, dtype=np.uint8),
             }
         )
 
-        if live_df.empty:
-            return
-
-        self.beginInsertRows(QModelIndex(), 0, live_df.shape[0] - 1)
-        self.df = pd.concat([live_df, self.df]) if not self.df.empty else live_df
-        self.endInsertRows()
-
-    def request_archive_data(self, pv_name: str, x_range: list[int] | tuple[int, int]) -> None:
+    def request_archive_data(self, pv_name: str, x_range: list[int] | tuple[int, int], use_cache: bool = True) -> None:
         """Request data from the Archiver Appliance for the given PV and time range.
         Only gets raw data, never optimized. Ends early if there is no environment
         variable PYDM_ARCHIVER_URL, which would contain the url for the Archiver
@@ -253,7 +610,13 @@ class DataVisualizationModel(QAbstractTableModel):
             The PV address to request data for
         x_range : list[int] | tuple[int, int]
             The time range to collect and store data between
+        use_cache : bool, optional
+            Whether a previous reply covering the range may be used instead, by default True
         """
+        # Skip the request if a previous reply already covers the range
+        if use_cache and self.load_cached_archive_data(pv_name, x_range):
+            return
+
         # Check the $PYDM_ARCHIVER_URL is populated
         base_url = os.getenv("PYDM_ARCHIVER_URL")
         if base_url is None:
@@ -264,20 +627,99 @@ class DataVisualizationModel(QAbstractTableModel):
             return
 
         # Correctly format the timestamps for the Archiver Appliance
-        from_dt = datetime.fromtimestamp(x_range[0], tz=timezone.utc)
-        from_date_str = from_dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
-
-        to_dt = datetime.fromtimestamp(x_range[1], tz=timezone.utc)
-        to_date_str = to_dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        from_date_str = archiver_timestamp(x_range[0])
+        to_date_str = archiver_timestamp(x_range[1])
 
         # Construct the request url and make the request
         url_string = f"{base_url}/retrieval/data/getData.json?pv={pv_name}&from={from_date_str}&to={to_date_str}"
         request = QNetworkRequest(QUrl(url_string))
-        self.network_manager.get(request)
+        # Let requests share a multiplexed or pipelined connection to the archiver. Qt already
+        # requests and decodes gzip; setting Accept-Encoding by hand would disable the decoding.
+        request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+        request.setAttribute(QNetworkRequest.HttpPipeliningAllowedAttribute, True)
+        request.setAttribute(QNetworkRequest.User, (pv_name, x_range[0], x_range[1]))
+        self._archive_reply_body = bytearray()
+        self.archive_reply = self.network_manager.get(request)
+        self.archive_reply.readyRead.connect(self.read_archive_reply)
+        self.archive_reply.downloadProgress.connect(self.reply_progress)
+
+    def abort_archive_reply(self) -> None:
+        """Abort the in-flight archiver request, if any, so its connection is freed
+        and its reply is ignored.
+        """
+        reply, self.archive_reply = self.archive_reply, None
+        self._archive_reply_body = bytearray()
+        if reply is not None and reply.isRunning():
+            reply.abort()
+
+    def load_cached_archive_data(self, pv_name: str, x_range: list[int] | tuple[int, int]) -> bool:
+        """Insert archive rows for the given PV and time range from a previous
+        reply whose range covers it, then emit reply_recieved.
 
+        Parameters
+        ----------
+        pv_name : str
+            The PV address to look up
+        x_range : list[int] | tuple[int, int]
+            The time range to collect and store data between
+
+        Returns
+        -------
+        bool
+            True if a cached reply covered the range, False if it must be requested
+        """
+        for cache_key, cached_df in self._archive_cache.items():
+            cached_pv, from_ts, to_ts = cache_key
+            if cached_pv == pv_name and from_ts <= x_range[0] and x_range[1] <= to_ts:
+                break
+        else:
+            return False
+        self._archive_cache.move_to_end(cache_key)
+
+        if not cached_df.empty:
+            left_dt, right_dt = _to_local_datetimes(x_range)
+            in_range = cached_df["Datetime"].between(left_dt, right_dt)
+            archive_df = cached_df if in_range.all() else cached_df[in_range]
+            if not archive_df.empty:
+                self._prepend_frame(self._frame_from_df(archive_df))
+
+        self.reply_recieved.emit()
+        return True
+
+    def cache_archive_df(self, cache_key: tuple[str, float, float], archive_df: pd.DataFrame | None) -> None:
+        """Remember the rows fetched for a PV and time range, evicting the least
+        recently used ranges once more than ARCHIVE_CACHE_MAX_ROWS are held.
+
+        Parameters
+        ----------
+        cache_key : tuple[str, float, float]
+            The PV address and the start and end of the requested range
+        archive_df : pd.DataFrame | None
+            The rows in the reply, or None if the reply held no data
+        """
+        if archive_df is None:
+            archive_df = pd.DataFrame(columns=self._df_columns)
+        self._archive_cache[cache_key] = archive_df
+        self._archive_cache.move_to_end(cache_key)
+
+        cached_rows = sum(df.shape[0] for df in self._archive_cache.values())
+        while cached_rows > ARCHIVE_CACHE_MAX_ROWS and len(self._archive_cache) > 1:
+            _, evicted_df = self._archive_cache.popitem(last=False)
+            cached_rows -= evicted_df.shape[0]
+
+    @Slot()
+    def read_archive_reply(self) -> None:
+        """Move the bytes received so far out of the current archiver reply, so the
+        reply's own buffer doesn't grow to hold the whole body.
+        """
+        reply = self.sender()
+        if reply is self.archive_reply:
+            self._archive_reply_body += memoryview(reply.readAll())
+
+    @Slot(QNetworkReply)
     def recieve_archive_reply(self, reply: QNetworkReply) -> None:
         """Process the recieved reply to the request made in request_archive_data.
-        Unpack the data and call set_archive_data. Mostly checks if the reply
+        Hand the data to an ArchiveParseThread. Mostly checks if the reply
         contains an error.
 
         Parameters
@@ -285,21 +727,58 @@ class DataVisualizationModel(QAbstractTableModel):
         reply : QNetworkReply
             Reply to the network request made in request_archive_data
         """
+        # Replies are routed by identity; one for an earlier request is stale
+        if reply is not self.archive_reply:
+            reply.deleteLater()
+            return
+        self.archive_reply = None
+
         if reply.error() == QNetworkReply.NoError:
-            bytes_str = reply.readAll()
-            try:
-                data_dict = json.loads(str(bytes_str, "utf-8"))
-                self.set_archive_data(data_dict)
-            except json.JSONDecodeError:
-                logger.warning("Data Insight Tool: No data received from archiver")
+            # A memoryview appends the QByteArray without an intermediate bytes copy,
+            # and both parsers accept the bytearray directly without a str decode
+            self._archive_reply_body += memoryview(reply.readAll())
+            reply_body, self._archive_reply_body = self._archive_reply_body, bytearray()
+            self.start_archive_parse(reply_body, reply.request().attribute(QNetworkRequest.User))
         else:
             logger.debug(
                 f"Request for data from archiver failed, request url: {reply.url()} retrieved header: "
                 f"{reply.header(QNetworkRequest.ContentTypeHeader)} error: {reply.error()}"
             )
-        self.reply_recieved.emit()
+            self.reply_recieved.emit()
         reply.deleteLater()
 
+    def start_archive_parse(self, reply_bytes: bytes | bytearray, cache_key: tuple | None = None) -> None:
+        """Parse an archiver reply on an ArchiveParseThread. The rows are
+        inserted and reply_recieved is emitted once parsing finishes.
+
+        Parameters
+        ----------
+        reply_bytes : bytes | bytearray
+            The raw body of the archiver's reply
+        cache_key : tuple | None, optional
+            The PV and time range that was requested, used to cache the rows, by default None
+        """
+        self.stop_archive_parse()
+        self.archive_parse_thread = ArchiveParseThread(self, reply_bytes, cache_key)
+        self.archive_parse_thread.result_ready.connect(self.insert_archive_df)
+        self.archive_parse_thread.finished.connect(self.release_archive_parse_thread)
+        self.archive_parse_thread.start()
+
+    @Slot()
+    def release_archive_parse_thread(self) -> None:
+        """Delete an ArchiveParseThread once it has finished, dropping the
+        model's reference to it if it is still the current thread.
+        """
+        sender = self.sender()
+        if sender is self.archive_parse_thread:
+            self.archive_parse_thread = None
+        sender.deleteLater()
+
+    def stop_archive_parse(self) -> None:
+        """Interrupt the running ArchiveParseThread, if any, so its result is discarded."""
+        if isinstance(self.archive_parse_thread, ArchiveParseThread) and self.archive_parse_thread.isRunning():
+            self.archive_parse_thread.stop()
+
     def set_archive_data(self, data_dict: dict) -> None:
         """Set the live data for the given curve in the given time range. Appends
         rows within the time range to the end of the model's dataframe.
@@ -309,19 +788,31 @@ class DataVisualizationModel(QAbstractTableModel):
         data_dict : dict
             Dictionary containing all data to be added to the model's dataframe
         """
-        points = data_dict[0]["data"]
-        archive_df = pd.DataFrame(
-            {
-                "Datetime": [datetime.fromtimestamp(p["secs"] + p["nanos"] * 1e-9) for p in points],
-                "Value": [p["val"] for p in points],
-                "Severity": [SEVERITY_MAP[p["severity"]] for p in points],
-                "Source": ["Archive"] * len(points),
-            }
-        )
+        self.insert_archive_df(build_archive_df(data_dict))
 
-        self.beginInsertRows(QModelIndex(), 0, archive_df.shape[0] - 1)
-        self.df = pd.concat([archive_df, self.df]) if not self.df.empty else archive_df
-        self.endInsertRows()
+    @Slot(object)
+    def insert_archive_df(self, archive_df: pd.DataFrame | None) -> None:
+        """Prepend already built archive rows to the model's dataframe. When
+        called by an ArchiveParseThread this also emits reply_recieved, and
+        results from a thread that has since been replaced are dropped.
+
+        Parameters
+        ----------
+        archive_df : pd.DataFrame | None
+            Rows built by build_archive_df, or None if there was nothing to add
+        """
+        sender = self.sender()
+        from_parse_thread = isinstance(sender, ArchiveParseThread)
+        if from_parse_thread and sender.cache_key is not None:
+            self.cache_archive_df(sender.cache_key, archive_df)
+        if from_parse_thread and sender is not self.archive_parse_thread:
+            return
+
+        if archive_df is not None and not archive_df.empty:
+            self._prepend_frame(self._frame_from_df(archive_df))
+
+        if from_parse_thread:
+            self.reply_recieved.emit()
 
     def export_data(self, file_path: Path, extension: str) -> None:
         """Export the model's data to the given file. Adds metadata to the top of
@@ -351,31 +842,50 @@ class DataVisualizationModel(QAbstractTableModel):
 
         header_dict = {"Address": self.address, "Unit": self.unit, "Description": self.description}
 
-        export_df = self.df.copy(deep=True)
-        export_df["Datetime"] = export_df["Datetime"].astype("int64") / 1e9
-
+        # Build the export frame from the model's columns without copying them
+        export_columns = dict(self.df.items())
+        export_columns["Datetime"] = self._epoch_seconds()
         if self.decode_as_string:
-            export_df["Value"] = export_df["Value"].apply(self.list_to_ascii)
+            export_columns["Value"] = self.df["Value"].apply(self.list_to_ascii)
+        export_df = pd.DataFrame(export_columns, copy=False)
 
         if extension == ".csv":
             file_header = "".join([f"{k}: {v}\n" for k, v in header_dict.items()])
-            with file_path.open("w") as file:
+            with file_path.open("w", newline="") as file:
                 file.write(file_header)
-                export_df.to_csv(file, index=False, mode="a")
+                writer = csv.writer(file, lineterminator="\n")
+                writer.writerow(export_df.columns)
+                writer.writerows(zip(*(col.tolist() for _, col in export_df.items())))
         elif extension == ".mat":
-            header_dict.update({name: col.values for name, col in export_df.items()})
-            savemat(file_path, header_dict)
+            mat_dict = {**header_dict, **{name: col.to_numpy() for name, col in export_df.items()}}
+            savemat(file_path, mat_dict, do_compression=True)
         elif extension == ".json":
             if export_df["Value"].dtype == object:
                 export_df["Value"] = export_df["Value"].astype("str")
+            # JSON has no NaN or Infinity, so write non-finite values as null
+            for name, col in export_df.items():
+                if pd.api.types.is_float_dtype(col):
+                    export_df[name] = col.astype(object).where(np.isfinite(col), None)
             data_dict = export_df.to_dict(orient="records")
             export_dict = {"meta": header_dict, "data": data_dict}
-            with file_path.open("w") as file:
-                json.dump(export_dict, file, indent=2)
+            file_path.write_bytes(json_dumps(export_dict))
+
+    def _epoch_seconds(self) -> np.ndarray:
+        """Return the Datetime column as seconds since the epoch for export. The
+        datetimes are reinterpreted as int64 nanoseconds without copying when
+        they are already stored at nanosecond resolution.
+        """
+        datetimes = self.df["Datetime"].to_numpy().astype("datetime64[ns]", copy=False)
+        return datetimes.view("int64") / 1e9
 
     def has_waveform_data(self) -> bool:
-        """Return True if any value in the Value column is a list or numpy array"""
-        return bool(self.df["Value"].apply(lambda v: isinstance(v, (list, np.ndarray))).any())
+        """Return True if any value in the Value column is a list or numpy array.
+        Reads the stored frames directly so the df isn't assembled on every reply.
+        """
+        return any(
+            frame["Value"].dtype == object and any(isinstance(v, (list, np.ndarray)) for v in frame["Value"])
+            for frame in self._frames
+        )
 
     @staticmethod
     def list_to_ascii(val: list[int]) -> str:
@@ -404,13 +914,21 @@ class DataInsightTool(QWidget):
 
         self.unopened = True
 
+        # Coalesce bursts of data requests into at most one per interval
+        self._pending_get_data = None
+        self._get_data_timer = QTimer(self)
+        self._get_data_timer.setSingleShot(True)
+        self._get_data_timer.setInterval(GET_DATA_THROTTLE_MS)
+        self._get_data_timer.timeout.connect(self.flush_get_data)
+
         self.data_vis_model.reply_recieved.connect(self.loading_label.hide)
+        self.data_vis_model.reply_progress.connect(self.show_reply_progress)
         self.data_vis_model.reply_recieved.connect(self.update_decode_as_string_visibility)
         self.data_vis_model.description_changed.connect(self.set_meta_data)
         self.export_button.clicked.connect(self.export_data_to_file)
         self.decode_as_string_checkbox.toggled.connect(self.set_decode_as_string)
-        self.pv_select_box.currentIndexChanged.connect(self.get_data)
-        self.refresh_button.clicked.connect(self.get_data)
+        self.pv_select_box.currentIndexChanged.connect(self.request_data)
+        self.refresh_button.clicked.connect(self.refresh_data)
 
         if isinstance(plot, PyDMArchiverTimePlot):
             self.plot = plot
@@ -463,6 +981,10 @@ class DataInsightTool(QWidget):
         # Set up the main data table in the center of the widget
         self.data_vis_model = DataVisualizationModel()
         self.data_table = FrozenTableView(self.data_vis_model)
+        # Fixed single-line rows so large replies don't trigger per-row height measurement
+        for table in (self.data_table, self.data_table.frozenTableView):
+            table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            table.setWordWrap(False)
         self.main_layout.addWidget(self.data_table)
 
         self.setLayout(self.main_layout)
@@ -473,6 +995,23 @@ class DataInsightTool(QWidget):
             self.get_data()
         super().show()
 
+    @Slot("qint64", "qint64")
+    def show_reply_progress(self, received: int, total: int) -> None:
+        """Show how much of the archiver reply has arrived in the loading label.
+
+        Parameters
+        ----------
+        received : int
+            The number of bytes received so far
+        total : int
+            The size of the reply in bytes, or -1 if the archiver didn't send it
+        """
+        if total > 0:
+            self.loading_label.setText(f"Loading... {100 * received // total}%")
+        else:
+            self.loading_label.setText(f"Loading... {received / 1e6:.1f} MB")
+
+    @Slot()
     def set_meta_data(self) -> None:
         """Populate the meta_data_label with the curve's unit (if any) and description."""
         meta_labels = []
@@ -500,6 +1039,7 @@ class DataInsightTool(QWidget):
             combobox_ind = self.pv_select_box.currentIndex()
         return self.plot.curveAtIndex(combobox_ind)
 
+    @Slot()
     def set_decode_as_string(self) -> None:
         """set the decode_as_string flag on the self.data_vis_model based off of the self.decode_as_string_checkbox
         then emit the dataChanged signal from the data_vis_model for the value column"""
@@ -516,12 +1056,20 @@ class DataInsightTool(QWidget):
     @Slot()
     def update_pv_select_box(self) -> None:
         """Populate the pv_select_box with all curves in the plot. This is called
-        when the plot is updated.
+        when the plot's curve list changes. The selected PV stays selected if it
+        is still plotted.
         """
+        curve_names = [c.address for c in self.plot._curves if isinstance(c, ArchivePlotCurveItem)]
+        current_names = [self.pv_select_box.itemText(i) for i in range(self.pv_select_box.count())]
+        if curve_names == current_names:
+            return
+
+        selected_name = self.pv_select_box.currentText()
         self.pv_select_box.blockSignals(True)
         self.pv_select_box.clear()
-        curve_names = [c.address for c in self.plot._curves if isinstance(c, ArchivePlotCurveItem)]
         self.pv_select_box.addItems(curve_names)
+        if selected_name in curve_names:
+            self.pv_select_box.setCurrentIndex(curve_names.index(selected_name))
         self.pv_select_box.blockSignals(False)
 
     @Slot()
@@ -537,7 +1085,7 @@ class DataInsightTool(QWidget):
         )
         if not extension_filter:
             return
-        extension = re.search(r"\*(.*?)\)", extension_filter).group(1)
+        extension = EXTENSION_FILTER_RE.search(extension_filter).group(1)
         file_name = Path(file_name).with_suffix(extension)
 
         try:
@@ -548,7 +1096,42 @@ class DataInsightTool(QWidget):
 
     @Slot()
     @Slot(int)
-    def get_data(self, combobox_index: int = -1) -> None:
+    def request_data(self, combobox_index: int = -1) -> None:
+        """Throttled entry point for get_data used by the UI. The first request
+        is handled immediately; further requests within GET_DATA_THROTTLE_MS
+        are collapsed into one that runs when the interval ends.
+
+        Parameters
+        ----------
+        combobox_index : int, optional
+            The index in the pv_select_box for the user selected curve, by default -1
+        """
+        if self._get_data_timer.isActive():
+            self._pending_get_data = combobox_index
+            return
+        self.get_data(combobox_index)
+        self._get_data_timer.start()
+
+    @Slot()
+    def flush_get_data(self) -> None:
+        """Run the most recent request collapsed by request_data, if any."""
+        if self._pending_get_data is None:
+            return
+        combobox_index = self._pending_get_data
+        self._pending_get_data = None
+        self.get_data(combobox_index)
+        self._get_data_timer.start()
+
+    @Slot()
+    def refresh_data(self) -> None:
+        """Refetch the selected curve's data, requesting archive data from the
+        archiver even if a previous reply covers the range.
+        """
+        self.get_data(use_cache=False)
+
+    @Slot()
+    @Slot(int)
+    def get_data(self, combobox_index: int = -1, use_cache: bool = True) -> None:
         """Prompt the DataVisualizationModel to fetch and save the data for the
         curve chosen by the user for the time range on the associated plot.
 
@@ -556,6 +1139,8 @@ class DataInsightTool(QWidget):
         ----------
         combobox_index : int, optional
             The index in the pv_select_box for the user selected curve, by default -1
+        use_cache : bool, optional
+            Whether archive data may come from a previous reply, by default True
         """
         if self.pv_select_box.count() < 1:
             logger.warning("Curves must be added to the main display before data can be requested.")
@@ -565,6 +1150,8 @@ class DataInsightTool(QWidget):
         x_range = self.plot.getXAxis().range
 
         self.decode_as_string_checkbox.hide()
-        self.data_vis_model.set_all_data(curve_item, x_range)
-        self.set_meta_data()
+        # Show the label first; a cached reply is recieved, hiding it, within set_all_data
+        self.loading_label.setText("Loading...")
         self.loading_label.show()
+        self.data_vis_model.set_all_data(curve_item, x_range, use_cache=use_cache)
+        self.set_meta_data()
@@ -170,6 +170,7 @@ class CurveModel(QAbstractTableModel):
         super().__init__()
         self.control_panel = control_panel
         self._headers = ["Variable Name", "Curve Name"]
+        self._keys = None
 
     def rowCount(self, parent=QModelIndex()) -> int:
         """Return the number of rows in the model."""
@@ -207,12 +208,14 @@ class CurveModel(QAbstractTableModel):
             return None
 
         # Get the key at this row
-        keys = list(curve_dict.keys())
+        keys = self._curve_keys()
         if index.row() >= len(keys):
             return None
 
         key = keys[index.row()]
-        curve = curve_dict[key]
+        curve = curve_dict.get(key)
+        if curve is None:
+            return None
 
         if role == Qt.DisplayRole:
             if index.column() == 0:
@@ -264,11 +267,24 @@ class CurveModel(QAbstractTableModel):
         if not (0 <= row < self.rowCount()):
             return None
 
+        return self._curve_keys()[row]
+
+    def _curve_keys(self) -> list[str]:
+        """Return the curve dictionary's keys in row order. The list is cached
+        between refreshes and rebuilt if the dictionary's size has changed.
+
+        Returns
+        -------
+        list[str]
+            The variable keys of all curves
+        """
         curve_dict = self.control_panel.curve_dict
-        keys = list(curve_dict.keys())
-        return keys[row]
+        if self._keys is None or len(self._keys) != len(curve_dict):
+            self._keys = list(curve_dict.keys())
+        return self._keys
 
     def refresh(self) -> None:
         """Force a refresh of the model data."""
         self.beginResetModel()
+        self._keys = None
         self.endResetModel()
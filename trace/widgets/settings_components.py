@@ -96,14 +96,26 @@ class ComboBoxWrapper(QComboBox):
         self.addItems(self.data_source.keys())
 
         if init_value is not None:
-            if str(init_value) in self.data_source:
-                self.setCurrentText(str(init_value))
-            else:
-                value_ind = list(self.data_source.values()).index(init_value)
-                self.setCurrentIndex(value_ind)
+            self.set_value(init_value)
 
         self.currentTextChanged.connect(self.clean_text_changed)
 
+    def set_value(self, value: int | str) -> None:
+        """Select the item whose display text or mapped value matches the given
+        value. Values not in the data source leave the selection unchanged.
+
+        Parameters
+        ----------
+        value : int or str
+            The display text or mapped value to select
+        """
+        if str(value) in self.data_source:
+            self.setCurrentText(str(value))
+            return
+        values = list(self.data_source.values())
+        if value in values:
+            self.setCurrentIndex(values.index(value))
+
     def clean_text_changed(self, inc_text: str) -> None:
         """Handle text changes and emit the mapped value.
 